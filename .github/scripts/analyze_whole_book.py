@@ -29,7 +29,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pydantic import BaseModel, ConfigDict, Field
 from scripts.utils.github_client import get_github_client  # noqa: E402
-from scripts.utils.github_client import get_repo, list_files_in_directory, read_file_content
+from scripts.utils.github_client import get_repo, list_files_in_directory, read_files_content
 from scripts.utils.knowledge_base import load_editorial_context  # noqa: E402
 from scripts.utils.llm_client import call_editorial, call_editorial_structured  # noqa: E402
 from scripts.utils.persona import load_persona  # noqa: E402
@@ -120,11 +120,10 @@ def load_all_chapters(repo) -> dict[str, str]:
 
     try:
         files = list_files_in_directory(repo, "chapters")
-        for file_info in files:
-            if file_info["name"].endswith(".md"):
-                content = read_file_content(repo, file_info["path"])
-                if content:
-                    chapters[file_info["name"]] = content
+        paths = [f"chapters/{name}" for name in files if name.endswith(".md")]
+        for path, content in read_files_content(repo, paths).items():
+            if content:
+                chapters[path.removeprefix("chapters/")] = content
     except Exception as e:
         print(f"Error loading chapters: {e}")
 
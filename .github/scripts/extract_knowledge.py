@@ -18,6 +18,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scripts.utils.github_client import get_github_client  # noqa: E402
 from scripts.utils.github_client import (
+    create_or_update_file,
     get_issue,
     get_issue_comments,
     get_repo,
@@ -105,16 +106,13 @@ Keep the summary under 200 words. Just provide the summary, no preamble."""
             existing.rstrip() + "\n" + json.dumps(entry) if existing.strip() else json.dumps(entry)
         )
 
-        # Use GitHub API to update file
-        try:
-            file = repo.get_contents(kb_path)
-            repo.update_file(
-                kb_path, f"Add knowledge from issue #{issue_number}", new_content, file.sha
-            )
-        except Exception:
-            repo.create_file(
-                kb_path, f"Initialize knowledge base with issue #{issue_number}", json.dumps(entry)
-            )
+        # Write through the client so the cached read above is invalidated
+        message = (
+            f"Add knowledge from issue #{issue_number}"
+            if existing.strip()
+            else f"Initialize knowledge base with issue #{issue_number}"
+        )
+        create_or_update_file(repo, kb_path, new_content, message, repo.default_branch)
     except Exception as e:
         print(f"Error updating knowledge base: {e}")
         sys.exit(1)
@@ -19,7 +19,7 @@ from scripts.utils.github_client import get_github_client  # noqa: E402
 from scripts.utils.github_client import (
     get_repo,
     list_files_in_directory,
-    read_file_content,
+    read_files_content,
 )
 from scripts.utils.knowledge_base import load_editorial_context  # noqa: E402
 from scripts.utils.llm_client import build_editorial_prompt, call_editorial  # noqa: E402
@@ -27,16 +27,14 @@ from scripts.utils.llm_client import build_editorial_prompt, call_editorial  # n
 
 def load_all_chapters(repo) -> dict:
     """Load all chapter content."""
-    chapters = {}
     chapter_files = list_files_in_directory(repo, "chapters")
+    paths = [f"chapters/{filename}" for filename in chapter_files if filename.endswith(".md")]
 
-    for filename in chapter_files:
-        if filename.endswith(".md"):
-            content = read_file_content(repo, f"chapters/{filename}")
-            if content:
-                chapters[filename] = content
-
-    return chapters
+    return {
+        path.removeprefix("chapters/"): content
+        for path, content in read_files_content(repo, paths).items()
+        if content
+    }
 
 
 def parse_issues_from_response(response: str) -> list:
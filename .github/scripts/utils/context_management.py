@@ -11,6 +11,7 @@ This ensures we never exceed model limits and handle long conversations
 gracefully (like issue #33 with 25+ comments).
 """
 
+import hashlib
 from typing import Optional
 
 import litellm
@@ -20,8 +21,14 @@ from .llm_client import (
     call_editorial,
     get_model,
     get_model_capabilities,
+    get_summary_model,
 )
 
+# Token counts keyed by (text digest, model), so cached chapters and comment
+# bodies are not kept alive. Oldest entries are evicted past the size bound.
+_TOKEN_COUNT_CACHE_SIZE = 4096
+_token_count_cache: dict[tuple[bytes, str], int] = {}
+
 
 class ContextBudget(BaseModel):
     """Token budget allocation for a conversation."""
@@ -69,14 +76,31 @@ def count_tokens(text: str, model: Optional[str] = None) -> int:
     Count tokens in text for a given model.
 
     Uses LiteLLM's token counter which handles different tokenizers.
+    Results are memoized per (text, model), since the same comment bodies
+    and prompts are re-counted across budgeting and summarization.
     """
     model = model or get_model()
+    key = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), model)
+    if key in _token_count_cache:
+        return _token_count_cache[key]
+
     try:
-        return litellm.token_counter(model=model, text=text)
+        tokens = litellm.token_counter(model=model, text=text)
     except Exception:
-        # Fallback: rough estimate of 4 chars per token
+        # Fallback: rough estimate of 4 chars per token (not cached, so a
+        # transient tokenizer failure doesn't pin the estimate)
         return len(text) // 4
 
+    if len(_token_count_cache) >= _TOKEN_COUNT_CACHE_SIZE:
+        del _token_count_cache[next(iter(_token_count_cache))]
+    _token_count_cache[key] = tokens
+    return tokens
+
+
+def clear_token_count_cache() -> None:
+    """Forget all memoized token counts."""
+    _token_count_cache.clear()
+
 
 def count_messages_tokens(messages: list[dict], model: Optional[str] = None) -> int:
     """Count tokens in a list of messages."""
@@ -247,6 +271,7 @@ Do NOT include any preamble. Start directly with the summary."""
     response = call_editorial(
         summary_prompt,
         system="You are a precise summarizer. Extract only the essential information.",
+        model=get_summary_model(),
         max_tokens=16000,
     )
 
@@ -15,11 +15,13 @@ This gives the AI "working memory" - it remembers what it asked
 and gently persists until questions are answered.
 """
 
+import json
 import re
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 
 class EstablishedFact(BaseModel):
@@ -42,6 +44,15 @@ class OutstandingQuestion(BaseModel):
     answered: bool = Field(default=False, description="Whether it's been answered")
     context: Optional[str] = Field(default=None, description="Why this question matters")
 
+    # Casefolded question text, computed once for substring matching
+    _folded: str = PrivateAttr(default="")
+
+    @model_validator(mode="after")
+    def _fold_question(self) -> "OutstandingQuestion":
+        """Cache the casefolded question text."""
+        self._folded = self.question.casefold()
+        return self
+
 
 class Prerequisite(BaseModel):
     """A prerequisite that must be met before a major action."""
@@ -53,6 +64,21 @@ class Prerequisite(BaseModel):
     blocks: str = Field(default="pr_creation", description="What action this blocks")
 
 
+def _question_key(question: str) -> str:
+    """Normalize a question for duplicate detection."""
+    return question.strip().casefold()
+
+
+def _fact_key(key: str) -> str:
+    """Normalize a fact key for lookup."""
+    return key.casefold()
+
+
+def _prerequisite_key(requirement: str) -> str:
+    """Normalize a prerequisite requirement for duplicate detection."""
+    return requirement.casefold()
+
+
 class ConversationState(BaseModel):
     """
     Complete state of an editorial conversation.
@@ -83,6 +109,23 @@ class ConversationState(BaseModel):
     # Metadata
     last_updated: Optional[str] = Field(default=None, description="When state was last updated")
 
+    # Normalized keys for O(1) duplicate checks in add_question / add_prerequisite
+    _question_keys: set[str] = PrivateAttr(default_factory=set)
+    _prerequisite_keys: set[str] = PrivateAttr(default_factory=set)
+    # Established facts by normalized key, for O(1) updates in establish_fact
+    _facts_by_key: dict[str, EstablishedFact] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _index_keys(self) -> "ConversationState":
+        """Build the lookup indexes from the initial lists."""
+        # Questions carry their casefolded text already; only the strip is left
+        self._question_keys = {q._folded.strip() for q in self.outstanding_questions}
+        self._prerequisite_keys = {_prerequisite_key(p.requirement) for p in self.prerequisites}
+        self._facts_by_key = {}
+        for fact in self.established:
+            self._facts_by_key.setdefault(_fact_key(fact.key), fact)
+        return self
+
     def has_unanswered_questions(self) -> bool:
         """Check if there are questions awaiting response."""
         return any(not q.answered for q in self.outstanding_questions)
@@ -102,10 +145,11 @@ class ConversationState(BaseModel):
     def add_question(self, question: str, context: Optional[str] = None) -> None:
         """Add a new outstanding question."""
         # Don't add duplicates
-        for q in self.outstanding_questions:
-            if q.question.lower().strip() == question.lower().strip():
-                return
+        key = _question_key(question)
+        if key in self._question_keys:
+            return
 
+        self._question_keys.add(key)
         self.outstanding_questions.append(
             OutstandingQuestion(
                 question=question,
@@ -117,8 +161,9 @@ class ConversationState(BaseModel):
 
     def mark_question_answered(self, question_substring: str) -> bool:
         """Mark a question as answered by matching substring."""
+        needle = question_substring.casefold()
         for q in self.outstanding_questions:
-            if question_substring.lower() in q.question.lower():
+            if needle in q._folded:
                 q.answered = True
                 return True
         return False
@@ -126,28 +171,30 @@ class ConversationState(BaseModel):
     def establish_fact(self, key: str, value: str) -> None:
         """Establish or update a fact."""
         # Update if exists
-        for fact in self.established:
-            if fact.key.lower() == key.lower():
-                fact.value = value
-                fact.established_at = datetime.now(timezone.utc).isoformat()
-                return
+        fact_key = _fact_key(key)
+        fact = self._facts_by_key.get(fact_key)
+        if fact is not None:
+            fact.value = value
+            fact.established_at = datetime.now(timezone.utc).isoformat()
+            return
 
         # Add new
-        self.established.append(
-            EstablishedFact(
-                key=key,
-                value=value,
-                established_at=datetime.now(timezone.utc).isoformat(),
-            )
+        fact = EstablishedFact(
+            key=key,
+            value=value,
+            established_at=datetime.now(timezone.utc).isoformat(),
         )
+        self._facts_by_key[fact_key] = fact
+        self.established.append(fact)
 
     def add_prerequisite(self, requirement: str, blocks: str = "pr_creation") -> None:
         """Add a prerequisite for an action."""
         # Don't add duplicates
-        for p in self.prerequisites:
-            if p.requirement.lower() == requirement.lower():
-                return
+        key = _prerequisite_key(requirement)
+        if key in self._prerequisite_keys:
+            return
 
+        self._prerequisite_keys.add(key)
         self.prerequisites.append(Prerequisite(requirement=requirement, met=False, blocks=blocks))
 
     def mark_prerequisite_met(self, requirement_substring: str) -> bool:
@@ -166,6 +213,14 @@ class ConversationState(BaseModel):
 STATE_SECTION_MARKER = "<!-- AI_EDITOR_STATE -->"
 STATE_SECTION_END = "<!-- /AI_EDITOR_STATE -->"
 
+# Subsection headers and line patterns for parse_state_from_body
+_ESTABLISHED_HEADER = "### ✅ Established"
+_QUESTIONS_HEADER = "### ⏳ Questions"
+_PREREQUISITES_HEADER = "### 🚧 Prerequisites"
+_PHASE_RE = re.compile(r"\*\*Phase:\*\*\s*(\w+)")
+_FACT_LINE_RE = re.compile(r"-\s+\*\*(.+?):\*\*\s+(.+)")
+_CHECKBOX_LINE_RE = re.compile(r"-\s+\[([ x])\]\s+(.+)")
+
 
 def format_state_markdown(state: ConversationState) -> str:
     """
@@ -223,61 +278,76 @@ def parse_state_from_body(issue_body: str, issue_number: int) -> ConversationSta
 
     Extracts the state section and parses checkboxes to determine status.
     """
-    state = ConversationState(issue_number=issue_number)
-
     # Find the state section
     if STATE_SECTION_MARKER not in issue_body:
-        return state
+        return ConversationState(issue_number=issue_number)
 
     # Extract section
     start = issue_body.find(STATE_SECTION_MARKER)
-    end = issue_body.find(STATE_SECTION_END)
+    end = issue_body.find(STATE_SECTION_END, start)
     if end == -1:
         end = len(issue_body)
 
     section = issue_body[start:end]
 
-    # Parse phase
-    phase_match = re.search(r"\*\*Phase:\*\*\s*(\w+)", section)
-    if phase_match:
-        state.phase = phase_match.group(1).lower()
-
-    # Parse established facts
-    established_section = re.search(r"### ✅ Established\n(.*?)(?=###|\Z)", section, re.DOTALL)
-    if established_section:
-        for line in established_section.group(1).strip().split("\n"):
-            match = re.match(r"-\s+\*\*(.+?):\*\*\s+(.+)", line)
+    # Single pass over the section: "###" headers (and the footer) switch
+    # which list the following bullet lines belong to.
+    phase = None
+    established = []
+    questions = []
+    prerequisites = []
+    current = None
+    for line in section.splitlines():
+        if line.startswith("###"):
+            if line.startswith(_ESTABLISHED_HEADER):
+                current = established
+            elif line.startswith(_QUESTIONS_HEADER):
+                current = questions
+            elif line.startswith(_PREREQUISITES_HEADER):
+                current = prerequisites
+            else:
+                current = None
+        elif line.startswith("*Updated"):
+            current = None
+        elif current is established:
+            match = _FACT_LINE_RE.match(line)
             if match:
-                state.established.append(EstablishedFact(key=match.group(1), value=match.group(2)))
-
-    # Parse outstanding questions (checkboxes)
-    questions_section = re.search(r"### ⏳ Questions.*?\n(.*?)(?=###|\Z)", section, re.DOTALL)
-    if questions_section:
-        for line in questions_section.group(1).strip().split("\n"):
+                # Regex groups are always str, so skip re-validation
+                established.append(
+                    EstablishedFact.model_construct(key=match.group(1), value=match.group(2))
+                )
+        elif current is questions:
             # Match checkbox: - [ ] or - [x]
-            match = re.match(r"-\s+\[([ x])\]\s+(.+)", line)
+            match = _CHECKBOX_LINE_RE.match(line)
             if match:
-                answered = match.group(1) == "x"
-                state.outstanding_questions.append(
+                questions.append(
                     OutstandingQuestion(
                         question=match.group(2),
                         asked_at="",  # Unknown from markdown
-                        answered=answered,
+                        answered=match.group(1) == "x",
                     )
                 )
-
-    # Parse prerequisites (checkboxes)
-    prereq_section = re.search(
-        r"### 🚧 Prerequisites.*?\n(.*?)(?=###|\*Updated|\Z)", section, re.DOTALL
-    )
-    if prereq_section:
-        for line in prereq_section.group(1).strip().split("\n"):
-            match = re.match(r"-\s+\[([ x])\]\s+(.+)", line)
+        elif current is prerequisites:
+            match = _CHECKBOX_LINE_RE.match(line)
             if match:
-                met = match.group(1) == "x"
-                state.prerequisites.append(Prerequisite(requirement=match.group(2), met=met))
+                prerequisites.append(
+                    Prerequisite.model_construct(
+                        requirement=match.group(2), met=match.group(1) == "x"
+                    )
+                )
+        elif phase is None:
+            phase_match = _PHASE_RE.search(line)
+            if phase_match:
+                phase = phase_match.group(1).lower()
 
-    return state
+    # Construct once so the duplicate-check indexes see every parsed item
+    return ConversationState(
+        issue_number=issue_number,
+        phase=phase or "discovery",
+        established=established,
+        outstanding_questions=questions,
+        prerequisites=prerequisites,
+    )
 
 
 def update_issue_body_with_state(current_body: str, state: ConversationState) -> str:
@@ -288,26 +358,27 @@ def update_issue_body_with_state(current_body: str, state: ConversationState) ->
     """
     state_markdown = format_state_markdown(state)
 
-    if STATE_SECTION_MARKER in current_body:
-        # Replace existing section
-        start = current_body.find(STATE_SECTION_MARKER)
+    start = current_body.find(STATE_SECTION_MARKER)
+    if start == -1:
+        # Append to body
+        return current_body.rstrip() + "\n" + state_markdown
 
-        # Find the --- before the marker
-        pre_marker = current_body.rfind("---", 0, start)
-        if pre_marker != -1 and current_body[pre_marker:start].strip() == "---":
-            start = pre_marker
+    # Replace existing section; a missing end marker means it runs to the end
+    end = current_body.find(STATE_SECTION_END, start)
+    if end == -1:
+        end = len(current_body)
+    else:
+        end += len(STATE_SECTION_END)
+        # Include any trailing newlines
+        while end < len(current_body) and current_body[end] == "\n":
+            end += 1
 
-        end = current_body.find(STATE_SECTION_END)
-        if end != -1:
-            end = end + len(STATE_SECTION_END)
-            # Include any trailing newlines
-            while end < len(current_body) and current_body[end] == "\n":
-                end += 1
+    # Find the --- before the marker
+    pre_marker = current_body.rfind("---", 0, start)
+    if pre_marker != -1 and current_body[pre_marker:start].strip() == "---":
+        start = pre_marker
 
-        return current_body[:start] + state_markdown + current_body[end:]
-    else:
-        # Append to body
-        return current_body.rstrip() + "\n" + state_markdown
+    return current_body[:start] + state_markdown + current_body[end:]
 
 
 # =============================================================================
@@ -373,50 +444,49 @@ def format_prerequisite_blocker(state: ConversationState, action: str = "pr_crea
     return "\n".join(lines)
 
 
+# Built once at import; get_default_prerequisites hands out copies
+_DEFAULT_PREREQUISITES = (
+    Prerequisite(
+        requirement="Content outline or structure defined",
+        met=False,
+        blocks="pr_creation",
+    ),
+    Prerequisite(
+        requirement="Actual chapter content written (not just ideas)",
+        met=False,
+        blocks="pr_creation",
+    ),
+)
+
+
 def get_default_prerequisites() -> list[Prerequisite]:
     """Get the default prerequisites for PR creation."""
-    return [
-        Prerequisite(
-            requirement="Content outline or structure defined",
-            met=False,
-            blocks="pr_creation",
-        ),
-        Prerequisite(
-            requirement="Actual chapter content written (not just ideas)",
-            met=False,
-            blocks="pr_creation",
-        ),
-    ]
+    return [p.model_copy() for p in _DEFAULT_PREREQUISITES]
+
+
+# Bold questions, e.g. "**What's the arc?**" (numbered ones included)
+_BOLD_QUESTION_RE = re.compile(r"\*\*([^*]+\?)\*\*")
 
 
 def extract_questions_from_response(response_text: str) -> list[str]:
     """
     Extract questions from an AI response that should be tracked.
 
-    Looks for lines ending with ? that seem like substantive questions.
+    Looks for bold questions (numbered or not) that seem substantive.
+    Returns them deduplicated, in order of first appearance.
     """
     questions = []
-
-    # Look for bold questions (often the important ones)
-    bold_questions = re.findall(r"\*\*([^*]+\?)\*\*", response_text)
-    questions.extend(bold_questions)
-
-    # Look for numbered questions
-    numbered = re.findall(r"\d+\.\s+\*\*([^*]+\?)\*\*", response_text)
-    questions.extend(numbered)
-
-    # Filter out rhetorical/short questions
-    filtered = []
-    for q in questions:
+    for match in _BOLD_QUESTION_RE.finditer(response_text):
+        q = match.group(1)
         # Skip very short questions (likely rhetorical)
         if len(q) < 20:
             continue
         # Skip questions that are just confirmations
         if q.lower().startswith(("does that", "sound good", "make sense")):
             continue
-        filtered.append(q.strip())
+        questions.append(q.strip())
 
-    return list(set(filtered))  # Dedupe
+    return list(dict.fromkeys(questions))  # Dedupe, keeping order
 
 
 # =============================================================================
@@ -424,6 +494,23 @@ def extract_questions_from_response(response_text: str) -> list[str]:
 # =============================================================================
 
 
+def _load_fact_keys(knowledge_path: Path) -> set[str]:
+    """Load the (lowercased) keys of facts already in the knowledge base."""
+    if not knowledge_path.exists():
+        return set()
+
+    existing_keys = set()
+    with open(knowledge_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                if entry.get("type") == "established_fact":
+                    existing_keys.add(entry.get("key", "").lower())
+            except json.JSONDecodeError:
+                continue
+    return existing_keys
+
+
 def persist_to_knowledge_base(
     state: ConversationState,
     knowledge_path: str = ".ai-context/knowledge.jsonl",
@@ -436,44 +523,36 @@ def persist_to_knowledge_base(
 
     Returns number of facts written.
     """
-    import json
-    from pathlib import Path
-
     if not state.established:
         return 0
 
     path = Path(knowledge_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Load existing knowledge to avoid duplicates
-    existing_keys = set()
-    if path.exists():
-        with open(path) as f:
-            for line in f:
-                try:
-                    entry = json.loads(line)
-                    if entry.get("type") == "established_fact":
-                        existing_keys.add(entry.get("key", "").lower())
-                except json.JSONDecodeError:
-                    continue
-
-    # Write new facts
-    written = 0
-    with open(path, "a") as f:
-        for fact in state.established:
-            if fact.key.lower() in existing_keys:
-                continue  # Skip duplicates
-
-            entry = {
-                "type": "established_fact",
-                "key": fact.key,
-                "value": fact.value,
-                "source_issue": state.issue_number,
-                "established_at": fact.established_at,
-            }
-            f.write(json.dumps(entry) + "\n")
-            written += 1
-            existing_keys.add(fact.key.lower())
+    # Load existing keys to avoid duplicates
+    existing_keys = _load_fact_keys(path)
+
+    # Collect new facts
+    lines = []
+    for fact in state.established:
+        if fact.key.lower() in existing_keys:
+            continue  # Skip duplicates
+
+        entry = {
+            "type": "established_fact",
+            "key": fact.key,
+            "value": fact.value,
+            "source_issue": state.issue_number,
+            "established_at": fact.established_at,
+        }
+        lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+        existing_keys.add(fact.key.lower())
+
+    # Append them in a single write
+    written = len(lines)
+    if lines:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
 
     if written > 0:
         print(f"Persisted {written} facts to knowledge base from issue #{state.issue_number}")
@@ -519,24 +598,22 @@ def compact_state(state: ConversationState) -> ConversationState:
     )
 
 
-def get_context_references(issue_number: int, repo=None) -> list[str]:
+def get_context_references(issue_number: int, repo=None) -> tuple[str, ...]:
     """
     Get references to where additional context can be found.
 
-    Returns list of references like:
+    Returns references like:
     - "Issue #33 (closed) - initial voice memo discussion"
     - "PR #34 (merged) - chapter integration"
     - "git log chapters/chapter-03.md - change history"
     """
-    references = []
-
     # If we have repo access, we could query for related issues/PRs
-    # For now, return a generic reference
-    references.append(f"Issue #{issue_number} comments - full conversation history")
-    references.append("git log --oneline -- chapters/ - chapter change history")
-    references.append(".ai-context/knowledge.jsonl - established facts from all issues")
-
-    return references
+    # For now, return generic references
+    return (
+        f"Issue #{issue_number} comments - full conversation history",
+        "git log --oneline -- chapters/ - chapter change history",
+        ".ai-context/knowledge.jsonl - established facts from all issues",
+    )
 
 
 def format_closing_summary(
@@ -1,9 +1,15 @@
 """GitHub API utilities for AI Book Editor."""
 
 import os
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
-from github import Github
+from github import Github, UnknownObjectException
+
+# Per-run cache of file reads, keyed on (repo full name, path, ref).
+# Editorial context is loaded more than once per workflow run (intent
+# inference, then PR creation), so the same files would be re-fetched.
+_content_cache: Dict[Tuple[str, str, Optional[str]], Optional[str]] = {}
 
 
 def get_github_client() -> Github:
@@ -32,15 +38,56 @@ def get_pull_request(repo, pr_number: int):
     return repo.get_pull(pr_number)
 
 
+def clear_content_cache() -> None:
+    """Forget all cached file reads."""
+    _content_cache.clear()
+
+
+def _forget_file(repo, path: str) -> None:
+    """Drop cached reads of a path (any ref) after it has been written."""
+    for key in [k for k in _content_cache if k[0] == repo.full_name and k[1] == path]:
+        del _content_cache[key]
+
+
 def read_file_content(repo, path: str, ref: str = None) -> Optional[str]:
-    """Read file content from repo. Returns None if file doesn't exist."""
+    """
+    Read file content from repo. Returns None if file doesn't exist.
+
+    Successful reads and missing files are cached for the rest of the run;
+    other errors are not, so a transient API failure is retried next call.
+    Only create_or_update_file() and append_to_file() invalidate the cache;
+    direct repo.update_file()/create_file()/delete_file() calls bypass it.
+    """
+    key = (repo.full_name, path, ref)
+    if key in _content_cache:
+        return _content_cache[key]
+
     try:
         kwargs = {"ref": ref} if ref else {}
         content = repo.get_contents(path, **kwargs)
-        return content.decoded_content.decode("utf-8")
+        text = content.decoded_content.decode("utf-8")
+    except UnknownObjectException:
+        text = None
     except Exception:
         return None
 
+    _content_cache[key] = text
+    return text
+
+
+def read_files_content(repo, paths: List[str], ref: Optional[str] = None) -> Dict[str, str]:
+    """
+    Read several files concurrently. Returns {path: content} for files that exist.
+
+    Each read is a separate REST round-trip, so fetching a whole chapters/
+    directory serially costs one RTT per file. Order follows `paths`.
+    """
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        contents = pool.map(lambda p: read_file_content(repo, p, ref), paths)
+        return {path: content for path, content in zip(paths, contents) if content is not None}
+
 
 def list_files_in_directory(repo, path: str, ref: str = None) -> List[str]:
     """List files in a directory."""
@@ -65,6 +112,7 @@ def create_branch(repo, branch_name: str, from_branch: str = None) -> bool:
 
 def create_or_update_file(repo, path: str, content: str, message: str, branch: str) -> None:
     """Create or update a file in the repo."""
+    _forget_file(repo, path)
     try:
         # Try to get existing file
         file = repo.get_contents(path, ref=branch)
@@ -78,6 +126,7 @@ def append_to_file(
     repo, path: str, content: str, message: str, branch: str, separator: str = "\n\n---\n\n"
 ) -> None:
     """Append content to an existing file."""
+    _forget_file(repo, path)
     try:
         file = repo.get_contents(path, ref=branch)
         existing = file.decoded_content.decode("utf-8")
@@ -9,6 +9,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from .github_client import list_files_in_directory, read_file_content
 from .persona import format_persona_for_prompt, get_default_persona, load_persona, resolve_persona
 from .phases import BookPhase, get_book_phase_guidance
+from .yaml_util import load_yaml
 
 # =============================================================================
 # BOOK CONFIGURATION MODELS
@@ -77,7 +78,7 @@ def load_book_config(repo) -> Optional[BookConfig]:
         return None
 
     try:
-        data = yaml.safe_load(content)
+        data = load_yaml(content)
         if not data:
             return None
 
@@ -217,7 +218,7 @@ def load_knowledge_base(repo) -> Dict[str, Any]:
     term_content = read_file_content(repo, ".ai-context/terminology.yaml")
     if term_content:
         try:
-            knowledge["terminology"] = yaml.safe_load(term_content) or {}
+            knowledge["terminology"] = load_yaml(term_content) or {}
         except yaml.YAMLError:
             pass
 
@@ -225,7 +226,7 @@ def load_knowledge_base(repo) -> Dict[str, Any]:
     themes_content = read_file_content(repo, ".ai-context/themes.yaml")
     if themes_content:
         try:
-            knowledge["themes"] = yaml.safe_load(themes_content) or []
+            knowledge["themes"] = load_yaml(themes_content) or []
         except yaml.YAMLError:
             pass
 
@@ -233,7 +234,7 @@ def load_knowledge_base(repo) -> Dict[str, Any]:
     prefs_content = read_file_content(repo, ".ai-context/author-preferences.yaml")
     if prefs_content:
         try:
-            knowledge["preferences"] = yaml.safe_load(prefs_content) or {}
+            knowledge["preferences"] = load_yaml(prefs_content) or {}
         except yaml.YAMLError:
             pass
 
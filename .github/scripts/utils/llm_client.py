@@ -548,7 +548,26 @@ def get_model() -> str:
     Raises:
         ValueError: If the model doesn't support reasoning
     """
-    model = os.environ.get("MODEL", DEFAULT_MODEL)
+    return _resolve_model(os.environ.get("MODEL", DEFAULT_MODEL))
+
+
+def get_summary_model() -> str:
+    """
+    Get the model for conversation summarization.
+
+    Summaries are a utility task, so SUMMARY_MODEL can route them to a cheaper
+    tier (e.g. SUMMARY_MODEL=cheap). Defaults to the main model, since a
+    cheaper tier may belong to a provider with no API key configured.
+
+    Raises:
+        ValueError: If the model doesn't support reasoning
+    """
+    summary_model = os.environ.get("SUMMARY_MODEL")
+    return _resolve_model(summary_model) if summary_model else get_model()
+
+
+def _resolve_model(model: str) -> str:
+    """Resolve a model name or alias, requiring reasoning support."""
     # Resolve aliases
     resolved = MODEL_ALIASES.get(model, model)
 
@@ -4,7 +4,6 @@ Loads and formats editor personas from JSON files for use in LLM prompts.
 Personas define the AI editor's personality traits, voice, and rules.
 """
 
-import json
 import os
 import re
 from pathlib import Path
@@ -13,6 +12,8 @@ from typing import List, Optional
 import yaml
 from pydantic import BaseModel, ConfigDict, Field
 
+from .yaml_util import load_yaml
+
 
 class PersonaTraits(BaseModel):
     """Numeric personality traits on a 0-10 scale."""
@@ -133,12 +134,13 @@ BUILTIN_PERSONAS = {
 # Label prefix for persona override
 PERSONA_LABEL_PREFIX = "persona:"
 
+# Personas live at the project root, four levels up from this file
+PERSONAS_DIR = Path(__file__).parent.parent.parent.parent / "personas"
+
 
 def get_personas_dir() -> Path:
     """Get the personas directory (relative to project root)."""
-    # When running from .github/scripts/, personas is at project root
-    script_dir = Path(__file__).parent.parent.parent.parent  # Up to project root
-    return script_dir / "personas"
+    return PERSONAS_DIR
 
 
 def load_persona(persona_id: str) -> Persona:
@@ -158,10 +160,7 @@ def load_persona(persona_id: str) -> Persona:
             f"Persona '{persona_id}' not found. Available: {', '.join(available)}"
         )
 
-    with open(persona_file) as f:
-        data = json.load(f)
-
-    return Persona.model_validate(data)
+    return Persona.model_validate_json(persona_file.read_bytes())
 
 
 def list_available_personas() -> List[str]:
@@ -190,7 +189,7 @@ def load_persona_config(repo) -> Optional[str]:
         return None
 
     try:
-        config = yaml.safe_load(config_content)
+        config = load_yaml(config_content)
         return config.get("persona") if config else None
     except yaml.YAMLError:
         return None
@@ -524,7 +523,7 @@ def get_persona_from_labels(labels: list) -> Optional[str]:
         label_name = label if isinstance(label, str) else getattr(label, "name", str(label))
 
         if label_name.startswith(PERSONA_LABEL_PREFIX):
-            persona_id = label_name[len(PERSONA_LABEL_PREFIX) :]
+            persona_id = label_name.removeprefix(PERSONA_LABEL_PREFIX)
             if persona_id in available:
                 return persona_id
             print(f"Warning: Label '{label_name}' persona not found. Available: {available}")
@@ -532,6 +531,14 @@ def get_persona_from_labels(labels: list) -> Optional[str]:
     return None
 
 
+_USE_COMMAND_RE = re.compile(r"@margot-ai-editor\s+use\s+(\S+)", re.IGNORECASE)
+_AS_COMMAND_RE = re.compile(
+    r"@margot-ai-editor\s+as\s+(\S+?)(?:\s*[,:]\s*(.*))?$", re.IGNORECASE | re.DOTALL
+)
+_LIST_COMMAND_RE = re.compile(r"@margot-ai-editor\s+list\s+personas?", re.IGNORECASE)
+_SWITCH_COMMAND_RE = re.compile(r"@margot-ai-editor\s+switch\s+to\s+(\S+)", re.IGNORECASE)
+
+
 def parse_persona_command(comment: str) -> tuple[Optional[str], Optional[str], str]:
     """
     Parse persona switching commands from a comment.
@@ -555,27 +562,25 @@ def parse_persona_command(comment: str) -> tuple[Optional[str], Optional[str], s
     text = comment.strip()
 
     # Pattern: @margot-ai-editor use <persona>
-    use_match = re.search(r"@margot-ai-editor\s+use\s+(\S+)", text, re.IGNORECASE)
+    use_match = _USE_COMMAND_RE.search(text)
     if use_match:
         persona_id = use_match.group(1).lower().strip()
         remaining = text[use_match.end() :].strip()
         return persona_id, "use", remaining
 
     # Pattern: @margot-ai-editor as <persona>: <request> or @margot-ai-editor as <persona>
-    as_match = re.search(
-        r"@margot-ai-editor\s+as\s+(\S+?)(?:\s*[,:]\s*(.*))?$", text, re.IGNORECASE | re.DOTALL
-    )
+    as_match = _AS_COMMAND_RE.search(text)
     if as_match:
         persona_id = as_match.group(1).lower().strip()
         remaining = (as_match.group(2) or "").strip()
         return persona_id, "as", remaining
 
     # Pattern: @margot-ai-editor list personas
-    if re.search(r"@margot-ai-editor\s+list\s+personas?", text, re.IGNORECASE):
+    if _LIST_COMMAND_RE.search(text):
         return None, "list", ""
 
     # Pattern: @margot-ai-editor switch to <persona>
-    switch_match = re.search(r"@margot-ai-editor\s+switch\s+to\s+(\S+)", text, re.IGNORECASE)
+    switch_match = _SWITCH_COMMAND_RE.search(text)
     if switch_match:
         persona_id = switch_match.group(1).lower().strip()
         remaining = text[switch_match.end() :].strip()
@@ -542,6 +542,22 @@ def detect_emotional_state(text: str) -> Optional[EmotionalState]:
     return max(scores, key=scores.get)
 
 
+# Author phrases that ask to go straight to feedback
+SKIP_DISCOVERY_PHRASES = (
+    "skip discovery",
+    "just review",
+    "skip the questions",
+    "don't ask",
+    "give me feedback",
+    "tear it apart",  # Confident = ready for feedback
+)
+
+# Labels that mean discovery is already done or not wanted
+SKIP_DISCOVERY_LABELS = frozenset(
+    {"quick-review", "phase:feedback", "phase:revision", "phase:polish"}
+)
+
+
 def should_skip_discovery(text: str, labels: List[str]) -> bool:
     """
     Check if discovery phase should be skipped.
@@ -551,25 +567,12 @@ def should_skip_discovery(text: str, labels: List[str]) -> bool:
     - Phase label is already feedback or later
     - Issue has "quick-review" label
     """
-    skip_phrases = [
-        "skip discovery",
-        "just review",
-        "skip the questions",
-        "don't ask",
-        "give me feedback",
-        "tear it apart",  # Confident = ready for feedback
-    ]
-
     text_lower = text.lower()
-    if any(phrase in text_lower for phrase in skip_phrases):
+    if any(phrase in text_lower for phrase in SKIP_DISCOVERY_PHRASES):
         return True
 
     # Check labels
-    skip_labels = ["quick-review", "phase:feedback", "phase:revision", "phase:polish"]
-    if any(lbl in labels for lbl in skip_labels):
-        return True
-
-    return False
+    return not SKIP_DISCOVERY_LABELS.isdisjoint(labels)
 
 
 def extract_knowledge_items(text: str) -> List[dict]:
@@ -0,0 +1,13 @@
+"""YAML parsing helpers for AI Book Editor."""
+
+from typing import Any
+
+import yaml
+
+# libyaml's C loader when PyYAML was built with it; same safe subset, faster parse
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(content: str) -> Any:
+    """Parse YAML with the safe loader (C-accelerated when available)."""
+    return yaml.load(content, Loader=_YAML_LOADER)
@@ -6,9 +6,34 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
+from github import Github
+from github.Repository import Repository
 
-# Add scripts path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / ".github" / "scripts"))
+# Add scripts and seeds paths for imports (once, however often conftest is loaded)
+repo_root = Path(__file__).resolve().parent.parent
+for _path in (str(repo_root / ".github" / "scripts"), str(repo_root / "seeds")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+
+@pytest.fixture(autouse=True)
+def clear_github_content_cache():
+    """Isolate tests from file reads cached by earlier tests."""
+    from scripts.utils.github_client import clear_content_cache
+
+    clear_content_cache()
+    yield
+    clear_content_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_token_count_cache():
+    """Isolate tests from token counts memoized by earlier tests."""
+    from scripts.utils.context_management import clear_token_count_cache
+
+    clear_token_count_cache()
+    yield
+    clear_token_count_cache()
 
 
 @pytest.fixture
@@ -46,7 +71,7 @@ def sample_pr():
 @pytest.fixture
 def mock_repo(sample_issue):
     """Mock GitHub repository object."""
-    repo = MagicMock()
+    repo = MagicMock(spec=Repository)
     repo.name = "ai-book-editor-test"
     repo.full_name = "VoiceWriter/ai-book-editor-test"
     repo.default_branch = "main"
@@ -99,7 +124,7 @@ def mock_repo(sample_issue):
 @pytest.fixture
 def mock_github_client(mock_repo):
     """Mock GitHub client."""
-    client = MagicMock()
+    client = MagicMock(spec=Github)
     client.get_repo.return_value = mock_repo
     return client
 
@@ -168,11 +193,19 @@ Yes, this is ready to integrate with minor clarification."""
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def seed_data():
-    """Load seed data for tests."""
+    """Load seed data once per test session (tests treat it as read-only)."""
     seed_file = Path(__file__).parent.parent / "seeds/issues.json"
     if seed_file.exists():
         with open(seed_file) as f:
             return json.load(f)
     return {"issues": [], "labels": []}
+
+
+@pytest.fixture(scope="session")
+def personas():
+    """Load every bundled persona once per test session (tests treat them as read-only)."""
+    from utils.persona import list_available_personas, load_persona
+
+    return {persona_id: load_persona(persona_id) for persona_id in list_available_personas()}
@@ -148,6 +148,48 @@ class TestCountTokens:
         tokens = count_tokens("")
         assert tokens == 0
 
+    def test_repeated_text_is_tokenized_once(self, mocker):
+        """count_tokens memoizes per (text, model)."""
+        counter = mocker.patch(
+            "scripts.utils.context_management.litellm.token_counter", return_value=7
+        )
+        text = "memoization probe for count_tokens"
+
+        assert count_tokens(text, "test-model") == 7
+        assert count_tokens(text, "test-model") == 7
+        assert counter.call_count == 1
+
+        count_tokens(text, "other-model")
+        assert counter.call_count == 2
+
+    def test_fallback_estimate_is_not_cached(self, mocker):
+        """count_tokens retries the tokenizer after a failed count."""
+        counter = mocker.patch(
+            "scripts.utils.context_management.litellm.token_counter",
+            side_effect=[RuntimeError("tokenizer unavailable"), 3],
+        )
+        text = "fallback probe for count_tokens"
+
+        assert count_tokens(text, "test-model") == len(text) // 4
+        assert count_tokens(text, "test-model") == 3
+        assert counter.call_count == 2
+
+    def test_token_cache_is_bounded(self, mocker, monkeypatch):
+        """count_tokens evicts the oldest memoized count past the size bound."""
+        from scripts.utils import context_management
+
+        monkeypatch.setattr(context_management, "_TOKEN_COUNT_CACHE_SIZE", 2)
+        counter = mocker.patch(
+            "scripts.utils.context_management.litellm.token_counter", return_value=7
+        )
+
+        for text in ("first", "second", "third"):
+            count_tokens(text, "test-model")
+        assert len(context_management._token_count_cache) == 2
+
+        count_tokens("first", "test-model")
+        assert counter.call_count == 4
+
 
 class TestGetContextBudget:
     """Tests for get_context_budget function."""
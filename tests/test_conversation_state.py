@@ -107,6 +107,18 @@ class TestConversationState:
         assert result is True
         assert state.outstanding_questions[0].answered is True
 
+    def test_mark_question_answered_ignores_case(self):
+        """mark_question_answered matches questions passed at construction regardless of case."""
+        state = ConversationState(
+            issue_number=1,
+            outstanding_questions=[
+                OutstandingQuestion(question="Who is your IDEAL reader?", asked_at="")
+            ],
+        )
+        assert state.mark_question_answered("ideal READER") is True
+        assert state.outstanding_questions[0].answered is True
+        assert state.mark_question_answered("word count") is False
+
     def test_establish_fact(self):
         """establish_fact adds new facts."""
         state = ConversationState(issue_number=1)
@@ -123,6 +135,18 @@ class TestConversationState:
         assert len(state.established) == 1
         assert state.established[0].value == "Millennials in cities"
 
+    def test_establish_fact_updates_initial_fact(self):
+        """establish_fact updates facts passed at construction, ignoring key case."""
+        state = ConversationState(
+            issue_number=1,
+            established=[EstablishedFact(key="Audience", value="Urban renters")],
+        )
+        state.establish_fact("audience", "Millennials in cities")
+        assert len(state.established) == 1
+        assert state.established[0].key == "Audience"
+        assert state.established[0].value == "Millennials in cities"
+        assert state.established[0].established_at is not None
+
     def test_has_unmet_prerequisites(self):
         """has_unmet_prerequisites returns True when prerequisites unmet."""
         state = ConversationState(issue_number=1)
@@ -143,6 +167,26 @@ class TestConversationState:
         state.add_prerequisite("Content written")
         assert len(state.prerequisites) == 1
 
+    def test_add_question_dedupes_against_initial_questions(self):
+        """add_question sees questions passed at construction time."""
+        state = ConversationState(
+            issue_number=1,
+            outstanding_questions=[
+                OutstandingQuestion(question="What's your goal?", asked_at="")
+            ],
+        )
+        state.add_question("  what's your goal?  ")
+        assert len(state.outstanding_questions) == 1
+
+    def test_add_prerequisite_dedupes_against_initial_prerequisites(self):
+        """add_prerequisite sees prerequisites passed at construction time."""
+        state = ConversationState(
+            issue_number=1,
+            prerequisites=[Prerequisite(requirement="Content written")],
+        )
+        state.add_prerequisite("CONTENT WRITTEN")
+        assert len(state.prerequisites) == 1
+
 
 class TestFormatStateMarkdown:
     """Tests for format_state_markdown function."""
@@ -233,6 +277,7 @@ class TestParseStateFromBody:
         assert len(state.established) == 2
         assert state.established[0].key == "audience"
         assert state.established[0].value == "Urban renters"
+        assert state.established[0].established_at is None
 
     def test_parses_outstanding_questions(self):
         """Parses outstanding questions with checkbox state."""
@@ -254,6 +299,10 @@ class TestParseStateFromBody:
         assert not state.outstanding_questions[0].answered
         assert state.outstanding_questions[1].answered
 
+        # Parsed questions participate in duplicate detection
+        state.add_question("What's your transformation arc?")
+        assert len(state.outstanding_questions) == 2
+
     def test_parses_prerequisites(self):
         """Parses prerequisites with checkbox state."""
         body = f"""# Voice Memo
@@ -274,6 +323,39 @@ class TestParseStateFromBody:
         assert len(state.prerequisites) == 2
         assert state.prerequisites[0].met is True
         assert state.prerequisites[1].met is False
+        assert state.prerequisites[0].blocks == "pr_creation"
+
+    def test_round_trips_formatted_state(self):
+        """Parses every section written by format_state_markdown."""
+        original = ConversationState(issue_number=42, phase="feedback")
+        original.establish_fact("audience", "Urban renters")
+        original.add_question("What's your transformation arc?")
+        original.add_prerequisite("Content outline defined")
+        original.mark_prerequisite_met("outline")
+
+        body = "# Voice Memo\n" + format_state_markdown(original)
+        state = parse_state_from_body(body, issue_number=42)
+
+        assert state.phase == "feedback"
+        assert [(f.key, f.value) for f in state.established] == [("audience", "Urban renters")]
+        assert [q.question for q in state.outstanding_questions] == [
+            "What's your transformation arc?"
+        ]
+        assert [(p.requirement, p.met) for p in state.prerequisites] == [
+            ("Content outline defined", True)
+        ]
+
+    def test_parses_crlf_body(self):
+        """Parses a state section saved with Windows line endings."""
+        original = ConversationState(issue_number=42)
+        original.establish_fact("tone", "Encouraging")
+        original.add_question("Who is your ideal reader?")
+
+        body = format_state_markdown(original).replace("\n", "\r\n")
+        state = parse_state_from_body(body, issue_number=42)
+
+        assert [(f.key, f.value) for f in state.established] == [("tone", "Encouraging")]
+        assert state.outstanding_questions[0].question == "Who is your ideal reader?"
 
 
 class TestUpdateIssueBodyWithState:
@@ -323,6 +405,18 @@ Footer content.
         # Should only have one state section
         assert result.count(STATE_SECTION_MARKER) == 1
 
+    def test_replaces_state_missing_end_marker(self):
+        """A state section without an end marker is replaced up to the end of the body."""
+        body = f"# Voice Memo\n\nContent here.\n\n---\n\n{STATE_SECTION_MARKER}\n**Phase:** Discovery"
+        state = ConversationState(issue_number=42, phase="feedback")
+
+        result = update_issue_body_with_state(body, state)
+
+        assert result.startswith("# Voice Memo\n\nContent here.\n")
+        assert result.endswith(f"{STATE_SECTION_END}\n")
+        assert "Discovery" not in result
+        assert result.count(STATE_SECTION_MARKER) == 1
+
 
 class TestFormatOutstandingQuestionsReminder:
     """Tests for format_outstanding_questions_reminder function."""
@@ -429,6 +523,19 @@ Let me repeat: **What's your transformation arc for your reader?**
         questions = extract_questions_from_response(response)
         assert len(questions) == 1
 
+    def test_keeps_first_appearance_order(self):
+        """Numbered and plain bold questions come back once, in order."""
+        response = """1. **Who is the reader you picture while writing?**
+2. **What should they be able to do afterwards?**
+
+**Who is the reader you picture while writing?**
+"""
+        questions = extract_questions_from_response(response)
+        assert questions == [
+            "Who is the reader you picture while writing?",
+            "What should they be able to do afterwards?",
+        ]
+
 
 class TestGetDefaultPrerequisites:
     """Tests for get_default_prerequisites function."""
@@ -440,6 +547,11 @@ class TestGetDefaultPrerequisites:
         assert all(isinstance(p, Prerequisite) for p in prereqs)
         assert all(not p.met for p in prereqs)
 
+    def test_returns_independent_copies(self):
+        """Mutating a returned prerequisite doesn't affect later calls."""
+        get_default_prerequisites()[0].met = True
+        assert not get_default_prerequisites()[0].met
+
 
 class TestCompactState:
     """Tests for compact_state function."""
@@ -533,6 +645,59 @@ class TestPersistToKnowledgeBase:
         lines = knowledge_path.read_text().strip().split("\n")
         assert len(lines) == 1  # Still only one entry
 
+    def test_writes_non_ascii_as_utf8(self, tmp_path):
+        """Non-ASCII facts are written as readable UTF-8 and still dedupe."""
+        import json
+
+        knowledge_path = tmp_path / "knowledge.jsonl"
+        state = ConversationState(issue_number=42)
+        state.establish_fact("Público", "Lectores jóvenes")
+        persist_to_knowledge_base(state, str(knowledge_path))
+
+        text = knowledge_path.read_text(encoding="utf-8")
+        assert "Lectores jóvenes" in text
+        assert json.loads(text)["key"] == "Público"
+        assert persist_to_knowledge_base(state, str(knowledge_path)) == 0
+
+    def test_dedupes_against_entries_added_elsewhere(self, tmp_path):
+        """Facts appended outside persist_to_knowledge_base are still deduped."""
+        import json
+
+        knowledge_path = tmp_path / "knowledge.jsonl"
+        state1 = ConversationState(issue_number=42)
+        state1.establish_fact("audience", "Urban renters")
+        persist_to_knowledge_base(state1, str(knowledge_path))
+
+        # Simulate an entry merged in from another branch
+        with open(knowledge_path, "a") as f:
+            f.write(json.dumps({"type": "established_fact", "key": "tone", "value": "Warm"}) + "\n")
+
+        state2 = ConversationState(issue_number=43)
+        state2.establish_fact("tone", "Blunt")
+        written = persist_to_knowledge_base(state2, str(knowledge_path))
+
+        assert written == 0
+
+    def test_dedupes_against_edited_keys(self, tmp_path):
+        """Each persist rescans the file, so a key renamed on disk dedupes by its new name."""
+        import json
+
+        knowledge_path = tmp_path / "knowledge.jsonl"
+        state1 = ConversationState(issue_number=42)
+        state1.establish_fact("tone", "Warm")
+        persist_to_knowledge_base(state1, str(knowledge_path))
+
+        knowledge_path.write_text(knowledge_path.read_text().replace('"tone"', '"mood"'))
+
+        state2 = ConversationState(issue_number=43)
+        state2.establish_fact("tone", "Blunt")
+        state2.establish_fact("mood", "x")
+        written = persist_to_knowledge_base(state2, str(knowledge_path))
+
+        assert written == 1
+        keys = [json.loads(line)["key"] for line in knowledge_path.read_text().splitlines()]
+        assert keys == ["mood", "tone"]
+
     def test_returns_zero_for_empty_state(self, tmp_path):
         """persist_to_knowledge_base returns 0 for empty state."""
         knowledge_path = tmp_path / "knowledge.jsonl"
@@ -547,7 +712,7 @@ class TestGetContextReferences:
     """Tests for get_context_references function."""
 
     def test_returns_references(self):
-        """get_context_references returns list of reference strings."""
+        """get_context_references returns reference strings."""
         refs = get_context_references(issue_number=42)
 
         assert len(refs) >= 1
@@ -15,30 +15,24 @@ These tests are skipped if no API key is available.
 
 import json
 import os
-import sys
-import tempfile
-from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
-# Add scripts to path
-sys.path.insert(0, str(Path(__file__).parent.parent / ".github" / "scripts"))
-
-from scripts.utils.context_management import (  # noqa: E402
+from scripts.utils.context_management import (
     count_tokens,
     prepare_conversation_context,
     summarize_conversation,
 )
-from scripts.utils.conversation_state import (  # noqa: E402
+from scripts.utils.conversation_state import (
     ConversationState,
     EstablishedFact,
     OutstandingQuestion,
     format_closing_summary,
     persist_to_knowledge_base,
 )
-from scripts.utils.llm_client import LLMResponse, LLMUsage  # noqa: E402
-from scripts.utils.pr_body import (  # noqa: E402
+from scripts.utils.llm_client import LLMResponse, LLMUsage
+from scripts.utils.pr_body import (
     ContentAnalysis,
     DecisionRecord,
     RichPRBody,
@@ -220,7 +214,7 @@ class TestClosingSummary:
 class TestKnowledgeBasePersistence:
     """Test 14.4: Knowledge base persistence."""
 
-    def test_persist_facts_to_knowledge_base(self):
+    def test_persist_facts_to_knowledge_base(self, tmp_path):
         """Established facts should be written to knowledge.jsonl."""
         state = ConversationState(
             issue_number=99,
@@ -231,27 +225,26 @@ class TestKnowledgeBasePersistence:
             ],
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            kb_path = Path(tmpdir) / "knowledge.jsonl"
+        kb_path = tmp_path / "knowledge.jsonl"
 
-            count = persist_to_knowledge_base(state, str(kb_path))
+        count = persist_to_knowledge_base(state, str(kb_path))
 
-            assert count == 2, "Should persist 2 facts"
-            assert kb_path.exists(), "Knowledge file should be created"
+        assert count == 2, "Should persist 2 facts"
+        assert kb_path.exists(), "Knowledge file should be created"
 
-            # Read and verify content
-            lines = kb_path.read_text().strip().split("\n")
-            assert len(lines) == 2, "Should have 2 lines"
+        # Read and verify content
+        lines = kb_path.read_text().strip().split("\n")
+        assert len(lines) == 2, "Should have 2 lines"
 
-            for line in lines:
-                entry = json.loads(line)
-                # Format: type, key, value, source_issue, established_at
-                assert entry["type"] == "established_fact"
-                assert "key" in entry
-                assert "value" in entry
-                assert entry["source_issue"] == 99
+        for line in lines:
+            entry = json.loads(line)
+            # Format: type, key, value, source_issue, established_at
+            assert entry["type"] == "established_fact"
+            assert "key" in entry
+            assert "value" in entry
+            assert entry["source_issue"] == 99
 
-    def test_persist_skips_duplicate_facts(self):
+    def test_persist_skips_duplicate_facts(self, tmp_path):
         """Should not write duplicate facts."""
         state = ConversationState(
             issue_number=99,
@@ -260,20 +253,19 @@ class TestKnowledgeBasePersistence:
             ],
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            kb_path = Path(tmpdir) / "knowledge.jsonl"
+        kb_path = tmp_path / "knowledge.jsonl"
 
-            # Write once
-            count1 = persist_to_knowledge_base(state, str(kb_path))
-            assert count1 == 1
+        # Write once
+        count1 = persist_to_knowledge_base(state, str(kb_path))
+        assert count1 == 1
 
-            # Write again - should skip duplicate
-            count2 = persist_to_knowledge_base(state, str(kb_path))
-            assert count2 == 0, "Should skip duplicate"
+        # Write again - should skip duplicate
+        count2 = persist_to_knowledge_base(state, str(kb_path))
+        assert count2 == 0, "Should skip duplicate"
 
-            # File should still have only 1 line
-            lines = kb_path.read_text().strip().split("\n")
-            assert len(lines) == 1
+        # File should still have only 1 line
+        lines = kb_path.read_text().strip().split("\n")
+        assert len(lines) == 1
 
 
 class TestRichPRBody:
@@ -407,7 +399,7 @@ class TestTokenCounting:
 class TestIntegrationWorkflow:
     """Full workflow integration tests."""
 
-    def test_full_context_management_workflow(self):
+    def test_full_context_management_workflow(self, tmp_path):
         """Test the complete workflow: conversation -> summarization -> closing."""
         # 1. Start with conversation state
         state = ConversationState(issue_number=100, phase="discovery")
@@ -431,7 +423,6 @@ class TestIntegrationWorkflow:
         assert "thesis" in summary.lower()  # Outstanding question
 
         # 6. Persist to knowledge base
-        with tempfile.TemporaryDirectory() as tmpdir:
-            kb_path = Path(tmpdir) / "knowledge.jsonl"
-            count = persist_to_knowledge_base(state, str(kb_path))
-            assert count == 2, "Should persist genre and audience facts"
+        kb_path = tmp_path / "knowledge.jsonl"
+        count = persist_to_knowledge_base(state, str(kb_path))
+        assert count == 2, "Should persist genre and audience facts"
@@ -94,6 +94,65 @@ class TestReadFileContent:
         read_file_content(mock_repo, "file.md", ref="feature-branch")
         mock_repo.get_contents.assert_called_with("file.md", ref="feature-branch")
 
+    def test_caches_repeated_reads(self, mock_repo):
+        """Should fetch each (path, ref) only once per run."""
+        from scripts.utils.github_client import read_file_content
+
+        read_file_content(mock_repo, "EDITOR_PERSONA.md")
+        read_file_content(mock_repo, "EDITOR_PERSONA.md")
+        read_file_content(mock_repo, "EDITOR_PERSONA.md", ref="feature-branch")
+        assert mock_repo.get_contents.call_count == 2
+
+    def test_does_not_cache_transient_errors(self):
+        """Should retry reads that failed for reasons other than a missing file."""
+        from scripts.utils.github_client import read_file_content
+
+        repo = MagicMock()
+        repo.get_contents.side_effect = Exception("Server error")
+
+        assert read_file_content(repo, "file.md") is None
+        assert read_file_content(repo, "file.md") is None
+        assert repo.get_contents.call_count == 2
+
+    def test_write_invalidates_cached_read(self, mock_repo):
+        """Should re-fetch a file after it is written through the helpers."""
+        from scripts.utils.github_client import create_or_update_file, read_file_content
+
+        read_file_content(mock_repo, "EDITOR_PERSONA.md")
+        create_or_update_file(mock_repo, "EDITOR_PERSONA.md", "New", "update", "main")
+        read_file_content(mock_repo, "EDITOR_PERSONA.md")
+
+        reads = [c for c in mock_repo.get_contents.call_args_list if c.kwargs == {}]
+        assert len(reads) == 2
+
+
+class TestReadFilesContent:
+    """Tests for read_files_content function."""
+
+    def test_reads_all_paths_in_order(self, mock_repo):
+        """Should return content keyed by path, in request order."""
+        from scripts.utils.github_client import read_files_content
+
+        paths = ["GLOSSARY.md", "EDITOR_PERSONA.md", "chapters/one.md"]
+        result = read_files_content(mock_repo, paths)
+
+        assert list(result) == paths
+        assert result["EDITOR_PERSONA.md"] == "You are a supportive editor."
+
+    def test_omits_missing_files(self, mock_repo):
+        """Should leave out files that could not be read."""
+        from scripts.utils.github_client import read_files_content
+
+        result = read_files_content(mock_repo, ["GLOSSARY.md", ".ai-context/missing.yaml"])
+        assert list(result) == ["GLOSSARY.md"]
+
+    def test_empty_paths(self, mock_repo):
+        """Should not touch the API for an empty request."""
+        from scripts.utils.github_client import read_files_content
+
+        assert read_files_content(mock_repo, []) == {}
+        mock_repo.get_contents.assert_not_called()
+
 
 class TestListFilesInDirectory:
     """Tests for list_files_in_directory function."""
@@ -1,17 +1,14 @@
 """Tests for the init script."""
 
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
-from github import GithubException
+from github import Github, GithubException
+from github.Repository import Repository
 
-# Import the module under test
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "seeds"))
-
-from init import (  # noqa: E402
+# seeds/ is put on sys.path by conftest.py
+from init import (
     AI_CONTEXT_FILES,
     ISSUE_TEMPLATES,
     LABELS,
@@ -20,63 +17,83 @@ from init import (  # noqa: E402
     create_labels,
     init_repository,
 )
+from scripts.utils.persona import BUILTIN_PERSONAS
+from scripts.utils.phases import PHASE_LABELS as CODE_PHASE_LABELS
+
+HEX_COLOR = re.compile(r"[0-9A-Fa-f]{6}")
+
+
+@pytest.fixture(scope="module")
+def label_names():
+    """Names of all defined labels."""
+    return frozenset(lbl["name"] for lbl in LABELS)
+
+
+@pytest.fixture
+def empty_repo():
+    """Mock repo with no labels and no files."""
+    repo = MagicMock(spec=Repository)
+    repo.get_labels.return_value = []
+    repo.get_contents.side_effect = GithubException(status=404, data={})
+    return repo
+
+
+@pytest.fixture
+def populated_repo():
+    """Mock repo where every requested file already exists."""
+    repo = MagicMock(spec=Repository)
+    repo.get_contents.return_value = MagicMock()
+    return repo
 
 
 class TestLabelDefinitions:
     """Test that all required labels are defined."""
 
-    def test_has_core_workflow_labels(self):
+    def test_has_core_workflow_labels(self, label_names):
         """Core workflow labels exist."""
-        names = {lbl["name"] for lbl in LABELS}
-        assert "voice_transcription" in names
-        assert "ai-reviewed" in names
-        assert "pr-created" in names
-        assert "awaiting-author" in names
-        assert "ai-question" in names
-        assert "ai-responded" in names
-
-    def test_has_phase_labels(self):
+        assert "voice_transcription" in label_names
+        assert "ai-reviewed" in label_names
+        assert "pr-created" in label_names
+        assert "awaiting-author" in label_names
+        assert "ai-question" in label_names
+        assert "ai-responded" in label_names
+
+    def test_has_phase_labels(self, label_names):
         """All editorial phase labels exist."""
-        names = {lbl["name"] for lbl in LABELS}
-        assert "phase:discovery" in names
-        assert "phase:feedback" in names
-        assert "phase:revision" in names
-        assert "phase:polish" in names
-        assert "phase:complete" in names
-        assert "phase:hold" in names
-
-    def test_has_persona_labels(self):
+        assert "phase:discovery" in label_names
+        assert "phase:feedback" in label_names
+        assert "phase:revision" in label_names
+        assert "phase:polish" in label_names
+        assert "phase:complete" in label_names
+        assert "phase:hold" in label_names
+
+    def test_has_persona_labels(self, label_names):
         """All persona override labels exist."""
-        names = {lbl["name"] for lbl in LABELS}
-        assert "persona:margot" in names
-        assert "persona:sage" in names
-        assert "persona:blueprint" in names
-        assert "persona:sterling" in names
-        assert "persona:the-axe" in names
-        assert "persona:cheerleader" in names
-        assert "persona:ivory-tower" in names
-        assert "persona:bestseller" in names
-
-    def test_all_labels_have_required_fields(self):
+        assert "persona:margot" in label_names
+        assert "persona:sage" in label_names
+        assert "persona:blueprint" in label_names
+        assert "persona:sterling" in label_names
+        assert "persona:the-axe" in label_names
+        assert "persona:cheerleader" in label_names
+        assert "persona:ivory-tower" in label_names
+        assert "persona:bestseller" in label_names
+
+    @pytest.mark.parametrize("label", LABELS, ids=lambda lbl: lbl.get("name"))
+    def test_label_has_required_fields(self, label):
         """Each label has name, color, description."""
-        for label in LABELS:
-            assert "name" in label, f"Label missing name: {label}"
-            assert "color" in label, f"Label {label['name']} missing color"
-            assert "description" in label, f"Label {label['name']} missing description"
+        assert "name" in label, f"Label missing name: {label}"
+        assert "color" in label, f"Label {label['name']} missing color"
+        assert "description" in label, f"Label {label['name']} missing description"
 
-    def test_label_colors_are_valid_hex(self):
+    @pytest.mark.parametrize("label", LABELS, ids=lambda lbl: lbl.get("name"))
+    def test_label_color_is_valid_hex(self, label):
         """Label colors are valid 6-char hex codes."""
-        for label in LABELS:
-            color = label["color"]
-            assert len(color) == 6, f"Label {label['name']} has invalid color length"
-            assert all(
-                c in "0123456789ABCDEFabcdef" for c in color
-            ), f"Label {label['name']} has invalid hex color: {color}"
-
-    def test_no_duplicate_labels(self):
+        color = label["color"]
+        assert HEX_COLOR.fullmatch(color), f"Label {label['name']} has invalid hex color: {color}"
+
+    def test_no_duplicate_labels(self, label_names):
         """No duplicate label names."""
-        names = [lbl["name"] for lbl in LABELS]
-        assert len(names) == len(set(names)), "Duplicate label names found"
+        assert len(LABELS) == len(label_names), "Duplicate label names found"
 
 
 class TestIssueTemplateDefinitions:
@@ -91,18 +108,17 @@ class TestIssueTemplateDefinitions:
         assert "whole-book-review.md" in names
         assert "editorial-hold.md" in names
 
-    def test_templates_have_frontmatter(self):
+    @pytest.mark.parametrize("template", ISSUE_TEMPLATES, ids=lambda t: t["name"])
+    def test_template_has_frontmatter(self, template):
         """Each template has YAML frontmatter."""
-        for template in ISSUE_TEMPLATES:
-            content = template["content"]
-            assert content.startswith("---"), f"Template {template['name']} missing frontmatter"
-            assert content.count("---") >= 2, f"Template {template['name']} has incomplete frontmatter"
+        content = template["content"]
+        assert content.startswith("---"), f"Template {template['name']} missing frontmatter"
+        assert content.count("---") >= 2, f"Template {template['name']} has incomplete frontmatter"
 
-    def test_templates_have_labels_in_frontmatter(self):
+    @pytest.mark.parametrize("template", ISSUE_TEMPLATES, ids=lambda t: t["name"])
+    def test_template_has_labels_in_frontmatter(self, template):
         """Each template specifies labels in frontmatter."""
-        for template in ISSUE_TEMPLATES:
-            content = template["content"]
-            assert "labels:" in content, f"Template {template['name']} missing labels"
+        assert "labels:" in template["content"], f"Template {template['name']} missing labels"
 
 
 class TestAIContextFiles:
@@ -124,19 +140,45 @@ class TestAIContextFiles:
         assert "chapters:" in config
 
 
-class TestCreateLabels:
-    """Test create_labels function."""
+CREATE_RESOURCES = [
+    pytest.param(create_labels, LABELS, "create_label", id="labels"),
+    pytest.param(create_issue_templates, ISSUE_TEMPLATES, "create_file", id="templates"),
+    pytest.param(create_ai_context, AI_CONTEXT_FILES, "create_file", id="ai_context"),
+]
+
 
-    def test_creates_new_labels(self):
-        """Creates labels that don't exist."""
-        mock_repo = MagicMock()
-        mock_repo.get_labels.return_value = []  # No existing labels
+class TestCreateResources:
+    """Behaviour shared by create_labels, create_issue_templates and create_ai_context."""
 
-        stats = create_labels(mock_repo, dry_run=False, verbose=False)
+    @pytest.mark.parametrize("create_fn,collection,api_method", CREATE_RESOURCES)
+    def test_creates_new_resources(self, empty_repo, create_fn, collection, api_method):
+        """Creates every resource that doesn't exist."""
+        stats = create_fn(empty_repo, dry_run=False, verbose=False)
 
-        assert stats["created"] == len(LABELS)
+        assert stats["created"] == len(collection)
         assert stats["existing"] == 0
-        assert mock_repo.create_label.call_count == len(LABELS)
+        assert getattr(empty_repo, api_method).call_count == len(collection)
+
+    @pytest.mark.parametrize("create_fn,collection,api_method", CREATE_RESOURCES)
+    def test_dry_run_creates_nothing(self, empty_repo, create_fn, collection, api_method):
+        """Dry run counts what it would create but creates nothing."""
+        stats = create_fn(empty_repo, dry_run=True, verbose=False)
+
+        assert stats["created"] == len(collection)
+        getattr(empty_repo, api_method).assert_not_called()
+
+    @pytest.mark.parametrize("create_fn,collection,api_method", CREATE_RESOURCES[1:])
+    def test_skips_existing_files(self, populated_repo, create_fn, collection, api_method):
+        """Skips files that already exist."""
+        stats = create_fn(populated_repo, dry_run=False, verbose=False)
+
+        assert stats["existing"] == len(collection)
+        assert stats["created"] == 0
+        getattr(populated_repo, api_method).assert_not_called()
+
+
+class TestCreateLabels:
+    """Label-specific behaviour of create_labels."""
 
     def test_skips_existing_labels(self):
         """Skips labels that already exist with correct settings."""
@@ -144,157 +186,49 @@ class TestCreateLabels:
         mock_label.name = "voice_transcription"
         mock_label.color = "1D76DB"
         mock_label.description = "Voice memo to process"
+        repo = MagicMock(spec=Repository)
+        repo.get_labels.return_value = [mock_label]
 
-        mock_repo = MagicMock()
-        mock_repo.get_labels.return_value = [mock_label]
-
-        stats = create_labels(mock_repo, dry_run=False, verbose=False)
+        stats = create_labels(repo, dry_run=False, verbose=False)
 
         assert stats["existing"] == 1
         assert stats["created"] == len(LABELS) - 1
 
-    def test_dry_run_creates_nothing(self):
-        """Dry run doesn't create any labels."""
-        mock_repo = MagicMock()
-        mock_repo.get_labels.return_value = []
-
-        stats = create_labels(mock_repo, dry_run=True, verbose=False)
-
-        assert stats["created"] == len(LABELS)
-        mock_repo.create_label.assert_not_called()
-
-    def test_handles_creation_errors(self):
+    def test_handles_creation_errors(self, empty_repo):
         """Handles errors when creating labels."""
-        mock_repo = MagicMock()
-        mock_repo.get_labels.return_value = []
-        mock_repo.create_label.side_effect = GithubException(
+        empty_repo.create_label.side_effect = GithubException(
             status=422, data={"message": "Validation Failed"}
         )
 
-        stats = create_labels(mock_repo, dry_run=False, verbose=False)
+        stats = create_labels(empty_repo, dry_run=False, verbose=False)
 
         assert stats["failed"] == len(LABELS)
         assert stats["created"] == 0
 
 
-class TestCreateIssueTemplates:
-    """Test create_issue_templates function."""
-
-    def test_creates_new_templates(self):
-        """Creates templates that don't exist."""
-        mock_repo = MagicMock()
-        mock_repo.get_contents.side_effect = GithubException(status=404, data={})
-
-        stats = create_issue_templates(mock_repo, dry_run=False, verbose=False)
-
-        assert stats["created"] == len(ISSUE_TEMPLATES)
-        assert mock_repo.create_file.call_count == len(ISSUE_TEMPLATES)
-
-    def test_skips_existing_templates(self):
-        """Skips templates that already exist."""
-        mock_repo = MagicMock()
-        mock_repo.get_contents.return_value = MagicMock()  # File exists
-
-        stats = create_issue_templates(mock_repo, dry_run=False, verbose=False)
-
-        assert stats["existing"] == len(ISSUE_TEMPLATES)
-        assert stats["created"] == 0
-        mock_repo.create_file.assert_not_called()
-
-    def test_dry_run_creates_nothing(self):
-        """Dry run doesn't create any templates."""
-        mock_repo = MagicMock()
-        mock_repo.get_contents.side_effect = GithubException(status=404, data={})
-
-        stats = create_issue_templates(mock_repo, dry_run=True, verbose=False)
-
-        assert stats["created"] == len(ISSUE_TEMPLATES)
-        mock_repo.create_file.assert_not_called()
-
-
-class TestCreateAIContext:
-    """Test create_ai_context function."""
-
-    def test_creates_new_files(self):
-        """Creates .ai-context files that don't exist."""
-        mock_repo = MagicMock()
-        mock_repo.get_contents.side_effect = GithubException(status=404, data={})
-
-        stats = create_ai_context(mock_repo, dry_run=False, verbose=False)
-
-        assert stats["created"] == len(AI_CONTEXT_FILES)
-        assert mock_repo.create_file.call_count == len(AI_CONTEXT_FILES)
-
-    def test_skips_existing_files(self):
-        """Skips files that already exist."""
-        mock_repo = MagicMock()
-        mock_repo.get_contents.return_value = MagicMock()  # File exists
-
-        stats = create_ai_context(mock_repo, dry_run=False, verbose=False)
-
-        assert stats["existing"] == len(AI_CONTEXT_FILES)
-        assert stats["created"] == 0
-
-    def test_dry_run_creates_nothing(self):
-        """Dry run doesn't create any files."""
-        mock_repo = MagicMock()
-        mock_repo.get_contents.side_effect = GithubException(status=404, data={})
-
-        stats = create_ai_context(mock_repo, dry_run=True, verbose=False)
-
-        assert stats["created"] == len(AI_CONTEXT_FILES)
-        mock_repo.create_file.assert_not_called()
-
-
 class TestInitRepository:
     """Test the main init_repository function."""
 
+    @pytest.mark.parametrize(
+        "flags,expected",
+        [
+            ({}, {"labels", "templates", "context"}),
+            ({"do_templates": False, "do_context": False}, {"labels"}),
+            ({"do_labels": False}, {"templates", "context"}),
+            ({"do_labels": False, "do_templates": False}, {"context"}),
+        ],
+        ids=["all-by-default", "labels-only", "skip-labels", "context-only"],
+    )
     @patch("init.get_github_client")
-    def test_initializes_all_by_default(self, mock_get_client):
-        """Initializes labels, templates, and context by default."""
-        mock_repo = MagicMock()
-        mock_repo.get_labels.return_value = []
-        mock_repo.get_contents.side_effect = GithubException(status=404, data={})
-
-        mock_client = MagicMock()
-        mock_client.get_repo.return_value = mock_repo
+    def test_initializes_selected_categories(self, mock_get_client, empty_repo, flags, expected):
+        """Initializes exactly the categories that are enabled."""
+        mock_client = MagicMock(spec=Github)
+        mock_client.get_repo.return_value = empty_repo
         mock_get_client.return_value = mock_client
 
-        results = init_repository(
-            "owner/repo",
-            do_labels=True,
-            do_templates=True,
-            do_context=True,
-            dry_run=True,
-            verbose=False,
-        )
+        results = init_repository("owner/repo", dry_run=True, verbose=False, **flags)
 
-        assert "labels" in results
-        assert "templates" in results
-        assert "context" in results
-
-    @patch("init.get_github_client")
-    def test_can_initialize_labels_only(self, mock_get_client):
-        """Can initialize just labels."""
-        mock_repo = MagicMock()
-        mock_repo.get_labels.return_value = []
-
-        mock_client = MagicMock()
-        mock_client.get_repo.return_value = mock_repo
-        mock_get_client.return_value = mock_client
-
-        results = init_repository(
-            "owner/repo",
-            do_labels=True,
-            do_templates=False,
-            do_context=False,
-            dry_run=True,
-            verbose=False,
-        )
-
-        assert "labels" in results
-        assert "templates" not in results
-        assert "context" not in results
+        assert set(results) == expected
 
 
 class TestLabelConsistencyWithCodebase:
@@ -302,10 +236,6 @@ class TestLabelConsistencyWithCodebase:
 
     def test_phase_labels_match_phases_module(self):
         """Phase labels match PHASE_LABELS in phases.py."""
-        # Import the actual phase labels from the codebase
-        sys.path.insert(0, str(Path(__file__).parent.parent / ".github" / "scripts"))
-        from utils.phases import PHASE_LABELS as CODE_PHASE_LABELS
-
         init_phase_labels = {
             lbl["name"] for lbl in LABELS if lbl["name"].startswith("phase:")
         }
@@ -317,9 +247,6 @@ class TestLabelConsistencyWithCodebase:
 
     def test_persona_labels_match_persona_module(self):
         """Persona labels match BUILTIN_PERSONAS in persona.py."""
-        sys.path.insert(0, str(Path(__file__).parent.parent / ".github" / "scripts"))
-        from utils.persona import BUILTIN_PERSONAS
-
         init_persona_labels = {
             lbl["name"].replace("persona:", "")
             for lbl in LABELS
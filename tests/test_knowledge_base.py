@@ -276,73 +276,53 @@ class TestGetBookProgress:
         assert result["chapters_drafted"] == 2
         assert result["chapters_planned"] == 0
 
-    def test_progress_new_phase(self):
-        """Should calculate completion based on planned chapters in NEW phase."""
+    @pytest.mark.parametrize(
+        "phase,statuses,target_chapters,expected_pct",
+        [
+            # NEW: planned chapters against the target (3/10)
+            (BookPhase.NEW, ["planned"] * 3, 10, 30.0),
+            # DRAFTING: drafted chapters (2/4)
+            (BookPhase.DRAFTING, ["drafted", "drafted", "planned", "planned"], None, 50.0),
+            # REVISING: revised chapters (1/3)
+            (BookPhase.REVISING, ["revised", "drafted", "drafted"], None, 33.3),
+            # POLISHING: polished chapters (2/3)
+            (BookPhase.POLISHING, ["polished", "polished", "revised"], None, 66.7),
+        ],
+        ids=["new", "drafting", "revising", "polishing"],
+    )
+    def test_progress_by_phase(self, phase, statuses, target_chapters, expected_pct):
+        """Should calculate completion from the chapters relevant to each phase."""
         config = BookConfig(
-            phase=BookPhase.NEW,
-            target_chapters=10,
+            phase=phase,
+            target_chapters=target_chapters,
             chapters=[
-                ChapterConfig(name="Ch1", status="planned"),
-                ChapterConfig(name="Ch2", status="planned"),
-                ChapterConfig(name="Ch3", status="planned"),
+                ChapterConfig(name=f"Ch{i}", status=status) for i, status in enumerate(statuses, 1)
             ],
         )
 
         result = get_book_progress(config, [])
 
         assert result["has_config"] is True
-        assert result["chapters_planned"] == 3
-        assert result["phase"] == "new"
-        assert result["completion_pct"] == 30.0  # 3/10 * 100
+        assert result["phase"] == phase.value
+        assert result["chapters_planned"] == len(statuses)
+        assert result["completion_pct"] == expected_pct
 
-    def test_progress_drafting_phase(self):
-        """Should calculate completion based on drafted chapters in DRAFTING phase."""
-        config = BookConfig(
-            phase=BookPhase.DRAFTING,
-            chapters=[
-                ChapterConfig(name="Ch1", status="drafted"),
-                ChapterConfig(name="Ch2", status="drafted"),
-                ChapterConfig(name="Ch3", status="planned"),
-                ChapterConfig(name="Ch4", status="planned"),
-            ],
-        )
-
-        result = get_book_progress(config, ["ch1.md", "ch2.md"])
-
-        assert result["chapters_drafted"] == 2
-        assert result["completion_pct"] == 50.0  # 2/4 * 100
-
-    def test_progress_revising_phase(self):
-        """Should calculate completion based on revised chapters in REVISING phase."""
-        config = BookConfig(
-            phase=BookPhase.REVISING,
-            chapters=[
-                ChapterConfig(name="Ch1", status="revised"),
-                ChapterConfig(name="Ch2", status="drafted"),
-                ChapterConfig(name="Ch3", status="drafted"),
-            ],
-        )
-
-        result = get_book_progress(config, [])
-
-        assert result["chapters_revised"] == 1
-        assert result["completion_pct"] == pytest.approx(33.3, rel=0.1)
-
-    def test_progress_polishing_phase(self):
-        """Should calculate completion based on polished chapters in POLISHING phase."""
+    def test_progress_counts_each_status_tier(self):
+        """Drafted includes revised/polished, and revised includes polished."""
         config = BookConfig(
             phase=BookPhase.POLISHING,
             chapters=[
-                ChapterConfig(name="Ch1", status="polished"),
-                ChapterConfig(name="Ch2", status="polished"),
-                ChapterConfig(name="Ch3", status="revised"),
+                ChapterConfig(name=f"Ch{i}", status=status)
+                for i, status in enumerate(["planned", "drafted", "revised", "polished"], 1)
             ],
         )
 
-        result = get_book_progress(config, [])
+        result = get_book_progress(config, ["ch1.md", "ch2.md"])
 
-        assert result["chapters_polished"] == 2
-        assert result["completion_pct"] == pytest.approx(66.7, rel=0.1)
+        assert result["chapters_drafted"] == 3
+        assert result["chapters_revised"] == 2
+        assert result["chapters_polished"] == 1
+        assert result["chapters_on_disk"] == 2
 
 
 class TestFormatBookContextForPrompt:
@@ -357,10 +337,10 @@ class TestFormatBookContextForPrompt:
         """Should include title and author in output."""
         config = BookConfig(title="Test Book", author="Test Author")
 
-        result = format_book_context_for_prompt(config)
+        lines = set(format_book_context_for_prompt(config).splitlines())
 
-        assert "**Title:** Test Book" in result
-        assert "**Author:** Test Author" in result
+        assert "**Title:** Test Book" in lines
+        assert "**Author:** Test Author" in lines
 
     def test_includes_phase_guidance(self):
         """Should include phase-specific guidance."""
@@ -378,13 +358,13 @@ class TestFormatBookContextForPrompt:
             core_themes=["AI", "Productivity"],
         )
 
-        result = format_book_context_for_prompt(config)
+        lines = set(format_book_context_for_prompt(config).splitlines())
 
-        assert "**Target Audience:**" in result
-        assert "Developers who want to learn" in result
-        assert "**Core Themes:**" in result
-        assert "- AI" in result
-        assert "- Productivity" in result
+        assert "**Target Audience:**" in lines
+        assert "Developers who want to learn" in lines
+        assert "**Core Themes:**" in lines
+        assert "- AI" in lines
+        assert "- Productivity" in lines
 
     def test_includes_author_goals(self):
         """Should include author goals when present."""
@@ -393,10 +373,10 @@ class TestFormatBookContextForPrompt:
             author_goals=["Inspire action", "Teach concepts"],
         )
 
-        result = format_book_context_for_prompt(config)
+        lines = set(format_book_context_for_prompt(config).splitlines())
 
-        assert "**Author's Goals:**" in result
-        assert "- Inspire action" in result
+        assert "**Author's Goals:**" in lines
+        assert "- Inspire action" in lines
 
     def test_includes_editorial_notes(self):
         """Should include editorial notes when present."""
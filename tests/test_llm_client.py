@@ -1,50 +1,66 @@
 """Tests for llm_client utilities."""
 
-import os
-from unittest.mock import patch
-
 import pytest
 
+from scripts.utils.llm_client import (
+    DEFAULT_MODEL,
+    MODEL_ALIASES,
+    LLMResponse,
+    build_editorial_prompt,
+    get_model,
+    get_model_capabilities,
+    get_summary_model,
+    supports_reasoning,
+)
+
 
 class TestGetModel:
     """Tests for get_model function."""
 
-    def test_default_model(self):
-        """Should return default model when no env var set."""
-        from scripts.utils.llm_client import DEFAULT_MODEL, get_model
-
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("MODEL", None)
-            result = get_model()
-            assert result == DEFAULT_MODEL
-
-    def test_custom_reasoning_model_from_env(self):
-        """Should return reasoning model from environment variable."""
-        from scripts.utils.llm_client import get_model
-
-        with patch.dict(os.environ, {"MODEL": "o3"}):
-            result = get_model()
-            assert result == "o3"
-
-    def test_non_reasoning_model_raises_error(self):
+    @pytest.mark.parametrize(
+        "model_env,expected",
+        [
+            (None, DEFAULT_MODEL),
+            ("o3", "o3"),
+            ("cheap", MODEL_ALIASES["cheap"]),
+            ("claude", MODEL_ALIASES["claude"]),
+        ],
+        ids=["default", "reasoning-model", "alias-cheap", "alias-claude"],
+    )
+    def test_resolves_model_from_env(self, monkeypatch, model_env, expected):
+        """Should return the default, a reasoning model, or a resolved alias."""
+        if model_env is None:
+            monkeypatch.delenv("MODEL", raising=False)
+        else:
+            monkeypatch.setenv("MODEL", model_env)
+        assert get_model() == expected
+
+    def test_non_reasoning_model_raises_error(self, monkeypatch):
         """Should raise error for non-reasoning models."""
-        from scripts.utils.llm_client import get_model
+        monkeypatch.setenv("MODEL", "gpt-4o")
+        with pytest.raises(ValueError, match="does not support reasoning"):
+            get_model()
+
 
-        with patch.dict(os.environ, {"MODEL": "gpt-4o"}):
-            with pytest.raises(ValueError, match="does not support reasoning"):
-                get_model()
+class TestGetSummaryModel:
+    """Tests for get_summary_model function."""
 
-    def test_model_alias_resolution(self):
-        """Should resolve model aliases."""
-        from scripts.utils.llm_client import MODEL_ALIASES, get_model
+    def test_defaults_to_main_model(self, monkeypatch):
+        """Should use the main model when SUMMARY_MODEL is not set."""
+        monkeypatch.setenv("MODEL", "o3")
+        monkeypatch.delenv("SUMMARY_MODEL", raising=False)
+        assert get_summary_model() == "o3"
 
-        with patch.dict(os.environ, {"MODEL": "cheap"}):
-            result = get_model()
-            assert result == MODEL_ALIASES["cheap"]
+    def test_resolves_summary_model_alias(self, monkeypatch):
+        """Should resolve SUMMARY_MODEL aliases."""
+        monkeypatch.setenv("SUMMARY_MODEL", "cheap")
+        assert get_summary_model() == MODEL_ALIASES["cheap"]
 
-        with patch.dict(os.environ, {"MODEL": "claude"}):
-            result = get_model()
-            assert result == MODEL_ALIASES["claude"]
+    def test_non_reasoning_summary_model_raises_error(self, monkeypatch):
+        """Should reject non-reasoning summary models."""
+        monkeypatch.setenv("SUMMARY_MODEL", "gpt-4o")
+        with pytest.raises(ValueError, match="does not support reasoning"):
+            get_summary_model()
 
 
 class TestModelCapabilities:
@@ -52,8 +68,6 @@ class TestModelCapabilities:
 
     def test_get_capabilities_for_known_model(self):
         """Should return capabilities for registered models."""
-        from scripts.utils.llm_client import get_model_capabilities
-
         caps = get_model_capabilities("claude-sonnet-4-5-20250929")
         assert caps is not None
         assert caps.reasoning is True
@@ -61,16 +75,12 @@ class TestModelCapabilities:
 
     def test_get_capabilities_for_alias(self):
         """Should resolve alias and return capabilities."""
-        from scripts.utils.llm_client import get_model_capabilities
-
         caps = get_model_capabilities("claude")
         assert caps is not None
         assert caps.reasoning is True
 
     def test_get_capabilities_for_unknown_model(self):
         """Should return None for unknown models."""
-        from scripts.utils.llm_client import get_model_capabilities
-
         caps = get_model_capabilities("unknown-model-xyz")
         assert caps is None
 
@@ -78,20 +88,17 @@ class TestModelCapabilities:
 class TestSupportsReasoning:
     """Tests for supports_reasoning function."""
 
-    def test_registered_model_supports_reasoning(self):
-        """Registered models should support reasoning."""
-        from scripts.utils.llm_client import supports_reasoning
-
-        assert supports_reasoning("claude-sonnet-4-5-20250929") is True
-        assert supports_reasoning("o3") is True
-        assert supports_reasoning("deepseek-reasoner") is True
-
-    def test_alias_supports_reasoning(self):
-        """Aliases should resolve and support reasoning."""
-        from scripts.utils.llm_client import supports_reasoning
+    @pytest.mark.parametrize(
+        "model",
+        ["claude-sonnet-4-5-20250929", "o3", "deepseek-reasoner", "claude", "cheap"],
+    )
+    def test_supports_reasoning(self, model):
+        """Registered models and aliases should support reasoning."""
+        assert supports_reasoning(model) is True
 
-        assert supports_reasoning("claude") is True
-        assert supports_reasoning("cheap") is True
+    def test_unknown_model_does_not_support_reasoning(self):
+        """Models outside the registry should not support reasoning."""
+        assert supports_reasoning("gpt-4o") is False
 
 
 class TestBuildEditorialPrompt:
@@ -99,8 +106,6 @@ class TestBuildEditorialPrompt:
 
     def test_builds_complete_prompt(self):
         """Should build prompt with all sections."""
-        from scripts.utils.llm_client import build_editorial_prompt
-
         result = build_editorial_prompt(
             persona="You are a helpful editor.",
             guidelines="Follow these rules.",
@@ -111,34 +116,43 @@ class TestBuildEditorialPrompt:
             content="Sample voice memo.",
         )
 
-        assert "# Your Persona" in result
-        assert "You are a helpful editor." in result
-        assert "# Editorial Guidelines" in result
-        assert "# Glossary" in result
-        assert "# Knowledge Base" in result
-        assert "# Existing Chapters" in result
-        assert "chapter-01.md, chapter-02.md" in result
-        assert "# Current Task" in result
-        assert "# Content to Process" in result
-        assert "# Important Reminders" in result
-
-    def test_omits_empty_sections(self):
-        """Should omit sections when values are None/empty."""
-        from scripts.utils.llm_client import build_editorial_prompt
-
+        required = (
+            "# Your Persona",
+            "You are a helpful editor.",
+            "# Editorial Guidelines",
+            "# Glossary",
+            "# Knowledge Base",
+            "# Existing Chapters",
+            "chapter-01.md, chapter-02.md",
+            "# Current Task",
+            "# Content to Process",
+            "# Important Reminders",
+        )
+        missing = [text for text in required if text not in result]
+        assert not missing, f"Prompt is missing: {missing}"
+
+    @pytest.mark.parametrize(
+        "chapter_list", [[], ["chapter-01.md"]], ids=["no-chapters", "chapters"]
+    )
+    @pytest.mark.parametrize("knowledge_base", [None, "Q&A pairs here."], ids=["no-kb", "kb"])
+    @pytest.mark.parametrize(
+        "glossary", [None, "Term definitions."], ids=["no-glossary", "glossary"]
+    )
+    def test_optional_sections_follow_inputs(self, glossary, knowledge_base, chapter_list):
+        """Should render each optional section only when its input is non-empty."""
         result = build_editorial_prompt(
             persona="Editor persona",
             guidelines="Guidelines",
-            glossary=None,
-            knowledge_base=None,
-            chapter_list=[],
+            glossary=glossary,
+            knowledge_base=knowledge_base,
+            chapter_list=chapter_list,
             task="Task here",
             content="Content here",
         )
 
-        assert "# Glossary" not in result
-        assert "# Knowledge Base" not in result
-        assert "# Existing Chapters" not in result
+        assert ("# Glossary" in result) == bool(glossary)
+        assert ("# Knowledge Base" in result) == bool(knowledge_base)
+        assert ("# Existing Chapters" in result) == bool(chapter_list)
 
 
 class TestLLMResponse:
@@ -146,8 +160,6 @@ class TestLLMResponse:
 
     def test_has_reasoning_with_reasoning_content(self):
         """Should detect reasoning content."""
-        from scripts.utils.llm_client import LLMResponse
-
         response = LLMResponse(
             content="Analysis here",
             reasoning="I thought about this carefully...",
@@ -156,15 +168,11 @@ class TestLLMResponse:
 
     def test_has_reasoning_without_reasoning(self):
         """Should return False when no reasoning."""
-        from scripts.utils.llm_client import LLMResponse
-
         response = LLMResponse(content="Just the answer")
         assert response.has_reasoning() is False
 
     def test_format_editorial_explanation(self):
         """Should format reasoning as collapsible section."""
-        from scripts.utils.llm_client import LLMResponse
-
         response = LLMResponse(
             content="Analysis", reasoning="Step 1: Read carefully. Step 2: Analyze."
         )
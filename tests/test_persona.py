@@ -1,18 +1,15 @@
 """Tests for persona utilities."""
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from operator import eq, ge
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-# Add scripts path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / ".github" / "scripts"))
-
 from utils.persona import (
     Persona,
     PersonaRules,
-    PersonaTraits,  # noqa: E402
+    PersonaTraits,
     PersonaVoice,
     format_discovery_prompt,
     format_feedback_with_tiers,
@@ -30,6 +27,12 @@ from utils.persona import (
 )
 
 
+@pytest.fixture(scope="module")
+def formatted_personas(personas):
+    """Format each bundled persona for the prompt once per module."""
+    return {persona_id: format_persona_for_prompt(p) for persona_id, p in personas.items()}
+
+
 class TestPersonaTraits:
     """Tests for PersonaTraits model."""
 
@@ -121,60 +124,31 @@ class TestPersona:
 class TestLoadPersona:
     """Tests for load_persona function."""
 
-    def test_load_margot(self):
-        """Test loading the Margot persona."""
-        persona = load_persona("margot")
-        assert persona.id == "margot"
-        assert persona.name == "Margot Fielding"
-        assert persona.traits.directness >= 8
-        assert persona.traits.ruthlessness >= 7
-
-    def test_load_sage(self):
-        """Test loading the Sage Holloway persona."""
-        persona = load_persona("sage")
-        assert persona.id == "sage"
-        assert persona.traits.praise_frequency >= 8
-        assert persona.traits.voice_protection == 10
-
-    def test_load_blueprint(self):
-        """Test loading the Maxwell Blueprint persona."""
-        persona = load_persona("blueprint")
-        assert persona.id == "blueprint"
-        assert persona.traits.structure_focus == 10
-
-    def test_load_sterling(self):
-        """Test loading the Sterling Chase persona."""
-        persona = load_persona("sterling")
-        assert persona.id == "sterling"
-        assert persona.traits.market_awareness == 10
-
-    def test_load_the_axe(self):
-        """Test loading The Axe persona (extreme)."""
-        persona = load_persona("the-axe")
-        assert persona.id == "the-axe"
-        assert persona.traits.ruthlessness == 10
-        assert persona.traits.praise_frequency == 1
-
-    def test_load_cheerleader(self):
-        """Test loading the Cheerleader persona (extreme)."""
-        persona = load_persona("cheerleader")
-        assert persona.id == "cheerleader"
-        assert persona.traits.praise_frequency == 10
-        assert persona.traits.ruthlessness == 1
-
-    def test_load_ivory_tower(self):
-        """Test loading the Ivory Tower persona (extreme)."""
-        persona = load_persona("ivory-tower")
-        assert persona.id == "ivory-tower"
-        assert persona.traits.formality == 10
-        assert persona.traits.market_awareness == 1
-
-    def test_load_bestseller(self):
-        """Test loading the Bestseller persona (extreme)."""
-        persona = load_persona("bestseller")
-        assert persona.id == "bestseller"
-        assert persona.traits.market_awareness == 10
-        assert persona.traits.voice_protection == 2
+    @pytest.mark.parametrize(
+        "persona_id,trait_checks",
+        [
+            ("margot", [("directness", ge, 8), ("ruthlessness", ge, 7)]),
+            ("sage", [("praise_frequency", ge, 8), ("voice_protection", eq, 10)]),
+            ("blueprint", [("structure_focus", eq, 10)]),
+            ("sterling", [("market_awareness", eq, 10)]),
+            ("the-axe", [("ruthlessness", eq, 10), ("praise_frequency", eq, 1)]),
+            ("cheerleader", [("praise_frequency", eq, 10), ("ruthlessness", eq, 1)]),
+            ("ivory-tower", [("formality", eq, 10), ("market_awareness", eq, 1)]),
+            ("bestseller", [("market_awareness", eq, 10), ("voice_protection", eq, 2)]),
+        ],
+        ids=lambda value: value if isinstance(value, str) else "traits",
+    )
+    def test_load_persona(self, persona_id, trait_checks):
+        """Test loading each bundled persona and its defining traits."""
+        persona = load_persona(persona_id)
+        assert persona.id == persona_id
+        for trait, op, expected in trait_checks:
+            actual = getattr(persona.traits, trait)
+            assert op(actual, expected), f"{persona_id}.{trait} = {actual}"
+
+    def test_load_margot_name(self):
+        """Test that Margot loads with her full name."""
+        assert load_persona("margot").name == "Margot Fielding"
 
     def test_load_nonexistent_persona(self):
         """Test loading a persona that doesn't exist."""
@@ -188,32 +162,21 @@ class TestListAvailablePersonas:
 
     def test_list_personas(self):
         """Test that all expected personas are listed."""
-        personas = list_available_personas()
-        # Core personas
-        assert "margot" in personas
-        assert "sage" in personas
-        assert "blueprint" in personas
-        assert "sterling" in personas
-        # Extreme personas
-        assert "the-axe" in personas
-        assert "cheerleader" in personas
-        assert "ivory-tower" in personas
-        assert "bestseller" in personas
-        # schema.json should not be included
-        assert "schema" not in personas
-        # Old names should not be present
-        assert "gentle-guide" not in personas
-        assert "structure-architect" not in personas
-        assert "market-realist" not in personas
+        persona_ids = set(list_available_personas())
+        core = {"margot", "sage", "blueprint", "sterling"}
+        extreme = {"the-axe", "cheerleader", "ivory-tower", "bestseller"}
+        assert core | extreme <= persona_ids, (core | extreme) - persona_ids
+        # schema.json should not be included, nor the old persona names
+        excluded = {"schema", "gentle-guide", "structure-architect", "market-realist"}
+        assert not excluded & persona_ids, excluded & persona_ids
 
 
 class TestFormatPersonaForPrompt:
     """Tests for format_persona_for_prompt function."""
 
-    def test_format_includes_key_sections(self):
+    def test_format_includes_key_sections(self, formatted_personas):
         """Test that formatting includes all key sections."""
-        persona = load_persona("margot")
-        formatted = format_persona_for_prompt(persona)
+        formatted = formatted_personas["margot"]
 
         assert "Margot Fielding" in formatted
         assert "Personality Traits" in formatted
@@ -222,10 +185,9 @@ class TestFormatPersonaForPrompt:
         assert "Always:" in formatted
         assert "Never:" in formatted
 
-    def test_format_includes_trait_values(self):
+    def test_format_includes_trait_values(self, formatted_personas):
         """Test that trait values are included."""
-        persona = load_persona("margot")
-        formatted = format_persona_for_prompt(persona)
+        formatted = formatted_personas["margot"]
 
         # Should include trait interpretations
         assert "Directness" in formatted
@@ -236,36 +198,33 @@ class TestFormatPersonaForPrompt:
 class TestLoadPersonaConfig:
     """Tests for load_persona_config function."""
 
-    def test_load_config_with_persona(self):
+    @pytest.fixture
+    def read_config(self):
+        """Patch the config read so each test only sets what it returns."""
+        with patch("utils.github_client.read_file_content") as read_file_content:
+            yield read_file_content
+
+    def test_load_config_with_persona(self, read_config):
         """Test loading config that has a persona."""
-        mock_repo = MagicMock()
-        with patch("utils.github_client.read_file_content", return_value="persona: margot"):
-            persona_id = load_persona_config(mock_repo)
-        assert persona_id == "margot"
+        read_config.return_value = "persona: margot"
+        repo = object()
+        assert load_persona_config(repo) == "margot"
+        read_config.assert_called_once_with(repo, ".ai-context/config.yaml")
 
-    def test_load_config_without_persona(self):
+    def test_load_config_without_persona(self, read_config):
         """Test loading config without persona key."""
-        mock_repo = MagicMock()
-        with patch("utils.github_client.read_file_content", return_value="other_key: value"):
-            persona_id = load_persona_config(mock_repo)
-        assert persona_id is None
+        read_config.return_value = "other_key: value"
+        assert load_persona_config(object()) is None
 
-    def test_load_config_no_file(self):
+    def test_load_config_no_file(self, read_config):
         """Test when config file doesn't exist."""
-        mock_repo = MagicMock()
-        with patch("utils.github_client.read_file_content", return_value=None):
-            persona_id = load_persona_config(mock_repo)
-        assert persona_id is None
+        read_config.return_value = None
+        assert load_persona_config(object()) is None
 
-    def test_load_config_invalid_yaml(self):
+    def test_load_config_invalid_yaml(self, read_config):
         """Test handling invalid YAML."""
-        mock_repo = MagicMock()
-        with patch(
-            "utils.github_client.read_file_content",
-            return_value="invalid: yaml: content: [",
-        ):
-            persona_id = load_persona_config(mock_repo)
-        assert persona_id is None
+        read_config.return_value = "invalid: yaml: content: ["
+        assert load_persona_config(object()) is None
 
 
 class TestGetDefaultPersona:
@@ -363,11 +322,10 @@ class TestGetPersonaFromLabels:
 
     def test_object_labels(self):
         """Test with label objects."""
-        label1 = MagicMock()
-        label1.name = "voice_transcription"
-        label2 = MagicMock()
-        label2.name = "persona:the-axe"
-        labels = [label1, label2]
+        labels = [
+            SimpleNamespace(name="voice_transcription"),
+            SimpleNamespace(name="persona:the-axe"),
+        ]
         persona_id = get_persona_from_labels(labels)
         assert persona_id == "the-axe"
 
@@ -387,27 +345,22 @@ class TestGetPersonaFromLabels:
 class TestGetPersonaFromEnv:
     """Tests for get_persona_from_env function."""
 
-    def test_valid_env_persona(self):
+    def test_valid_env_persona(self, monkeypatch):
         """Test with valid EDITOR_PERSONA env var."""
-        with patch.dict("os.environ", {"EDITOR_PERSONA": "margot"}):
-            persona_id = get_persona_from_env()
+        monkeypatch.setenv("EDITOR_PERSONA", "margot")
+        persona_id = get_persona_from_env()
         assert persona_id == "margot"
 
-    def test_invalid_env_persona(self):
+    def test_invalid_env_persona(self, monkeypatch):
         """Test with invalid EDITOR_PERSONA env var."""
-        with patch.dict("os.environ", {"EDITOR_PERSONA": "nonexistent"}):
-            persona_id = get_persona_from_env()
+        monkeypatch.setenv("EDITOR_PERSONA", "nonexistent")
+        persona_id = get_persona_from_env()
         assert persona_id is None
 
-    def test_no_env_persona(self):
+    def test_no_env_persona(self, monkeypatch):
         """Test when EDITOR_PERSONA is not set."""
-        with patch.dict("os.environ", {}, clear=True):
-            # Clear the env var if it exists
-            import os
-
-            if "EDITOR_PERSONA" in os.environ:
-                del os.environ["EDITOR_PERSONA"]
-            persona_id = get_persona_from_env()
+        monkeypatch.delenv("EDITOR_PERSONA", raising=False)
+        persona_id = get_persona_from_env()
         assert persona_id is None
 
 
@@ -421,29 +374,25 @@ class TestResolvePersona:
         assert persona_id == "the-axe"
         assert source == "command"
 
-    def test_label_over_env(self):
+    def test_label_over_env(self, monkeypatch):
         """Test that label beats env var."""
-        with patch.dict("os.environ", {"EDITOR_PERSONA": "margot"}):
-            labels = ["persona:blueprint"]
-            persona_id, source = resolve_persona(labels=labels)
+        monkeypatch.setenv("EDITOR_PERSONA", "margot")
+        labels = ["persona:blueprint"]
+        persona_id, source = resolve_persona(labels=labels)
         assert persona_id == "blueprint"
         assert source == "label"
 
-    def test_env_when_no_label(self):
+    def test_env_when_no_label(self, monkeypatch):
         """Test env var when no label."""
-        with patch.dict("os.environ", {"EDITOR_PERSONA": "sterling"}):
-            persona_id, source = resolve_persona(labels=[])
+        monkeypatch.setenv("EDITOR_PERSONA", "sterling")
+        persona_id, source = resolve_persona(labels=[])
         assert persona_id == "sterling"
         assert source == "env"
 
-    def test_default_when_nothing_set(self):
+    def test_default_when_nothing_set(self, monkeypatch):
         """Test default when nothing is configured."""
-        with patch.dict("os.environ", {}, clear=True):
-            import os
-
-            if "EDITOR_PERSONA" in os.environ:
-                del os.environ["EDITOR_PERSONA"]
-            persona_id, source = resolve_persona(labels=[])
+        monkeypatch.delenv("EDITOR_PERSONA", raising=False)
+        persona_id, source = resolve_persona(labels=[])
         assert persona_id is None
         assert source == "default"
 
@@ -469,27 +418,24 @@ class TestFormatPersonaList:
 class TestFormatPersonaWithColleagues:
     """Tests for colleague awareness in persona formatting."""
 
-    def test_includes_colleagues_section(self):
+    def test_includes_colleagues_section(self, formatted_personas):
         """Test that formatted persona includes colleagues."""
-        persona = load_persona("margot")
-        formatted = format_persona_for_prompt(persona)
+        formatted = formatted_personas["margot"]
         assert "Your Colleagues" in formatted
         assert "Sage Holloway" in formatted
         assert "Maxwell Blueprint" in formatted
 
-    def test_excludes_self_from_colleagues(self):
+    def test_excludes_self_from_colleagues(self, formatted_personas):
         """Test that persona doesn't list itself as colleague."""
-        persona = load_persona("margot")
-        formatted = format_persona_for_prompt(persona)
+        formatted = formatted_personas["margot"]
         # Margot should not appear in the colleagues section
         # (she's in the header but not in the colleagues list)
         colleagues_section = formatted.split("Your Colleagues")[1]
         assert "as margot" not in colleagues_section
 
-    def test_includes_embodiment_instructions(self):
+    def test_includes_embodiment_instructions(self, formatted_personas):
         """Test that persona includes character embodiment instructions."""
-        persona = load_persona("the-axe")
-        formatted = format_persona_for_prompt(persona)
+        formatted = formatted_personas["the-axe"]
         assert "You ARE" in formatted
         assert "Never break character" in formatted
 
@@ -497,37 +443,36 @@ class TestFormatPersonaWithColleagues:
 class TestPersonaDiscovery:
     """Tests for discovery questions in personas."""
 
-    def test_all_personas_have_discovery(self):
+    @pytest.mark.parametrize("persona_id", list_available_personas())
+    def test_all_personas_have_discovery(self, personas, persona_id):
         """Test that all personas have discovery sections."""
-        for persona_id in list_available_personas():
-            persona = load_persona(persona_id)
-            assert persona.discovery is not None, f"{persona_id} missing discovery"
+        assert personas[persona_id].discovery is not None
 
-    def test_discovery_has_intake_questions(self):
+    def test_discovery_has_intake_questions(self, personas):
         """Test that personas have intake questions."""
-        persona = load_persona("margot")
+        persona = personas["margot"]
         assert len(persona.discovery.intake_questions) >= 2
 
-    def test_discovery_has_socratic_prompts(self):
+    def test_discovery_has_socratic_prompts(self, personas):
         """Test that personas have Socratic prompts."""
-        persona = load_persona("sage")
+        persona = personas["sage"]
         assert len(persona.discovery.socratic_prompts) >= 2
 
-    def test_discovery_has_philosophy(self):
+    def test_discovery_has_philosophy(self, personas):
         """Test that personas have discovery philosophy."""
-        persona = load_persona("blueprint")
+        persona = personas["blueprint"]
         assert persona.discovery.philosophy
         assert len(persona.discovery.philosophy) > 10
 
-    def test_discovery_questions_match_personality(self):
+    def test_discovery_questions_match_personality(self, personas):
         """Test that discovery questions match persona personality."""
         # The Axe should have direct, harsh questions
-        axe = load_persona("the-axe")
+        axe = personas["the-axe"]
         questions = " ".join(axe.discovery.intake_questions)
         assert "cut" in questions.lower() or "willing" in questions.lower()
 
         # Sage should have gentle, nurturing questions
-        sage = load_persona("sage")
+        sage = personas["sage"]
         questions = " ".join(sage.discovery.intake_questions)
         assert "feeling" in questions.lower() or "support" in questions.lower()
 
@@ -535,57 +480,56 @@ class TestPersonaDiscovery:
 class TestPersonaFeedbackTiers:
     """Tests for feedback tier labels in personas."""
 
-    def test_all_personas_have_feedback_tiers(self):
+    @pytest.mark.parametrize("persona_id", list_available_personas())
+    def test_all_personas_have_feedback_tiers(self, personas, persona_id):
         """Test that all personas have feedback tier labels."""
-        for persona_id in list_available_personas():
-            persona = load_persona(persona_id)
-            assert persona.feedback_tiers is not None, f"{persona_id} missing feedback_tiers"
+        assert personas[persona_id].feedback_tiers is not None
 
-    def test_feedback_tiers_have_all_levels(self):
+    def test_feedback_tiers_have_all_levels(self, personas):
         """Test that feedback tiers have all three levels."""
-        persona = load_persona("margot")
+        persona = personas["margot"]
         assert persona.feedback_tiers.critical_label
         assert persona.feedback_tiers.recommended_label
         assert persona.feedback_tiers.optional_label
 
-    def test_feedback_tiers_match_personality(self):
+    def test_feedback_tiers_match_personality(self, personas):
         """Test that tier labels match persona personality."""
         # The Axe should have blunt labels
-        axe = load_persona("the-axe")
+        axe = personas["the-axe"]
         assert "cut" in axe.feedback_tiers.critical_label.lower()
 
         # Cheerleader should have positive labels
-        cheerleader = load_persona("cheerleader")
+        cheerleader = personas["cheerleader"]
         assert "!" in cheerleader.feedback_tiers.critical_label
 
 
 class TestFormatDiscoveryPrompt:
     """Tests for format_discovery_prompt function."""
 
-    def test_includes_persona_name(self):
+    def test_includes_persona_name(self, personas):
         """Test that discovery prompt includes persona name."""
-        persona = load_persona("margot")
+        persona = personas["margot"]
         formatted = format_discovery_prompt(persona)
         assert "Margot" in formatted
         assert "Discovery Mode" in formatted
 
-    def test_includes_questions(self):
+    def test_includes_questions(self, personas):
         """Test that discovery prompt includes question types."""
-        persona = load_persona("sage")
+        persona = personas["sage"]
         formatted = format_discovery_prompt(persona)
         assert "Intake questions" in formatted
         assert "Socratic prompts" in formatted
 
-    def test_includes_emotional_state_guidance(self):
+    def test_includes_emotional_state_guidance(self, personas):
         """Test that emotional state affects prompt."""
-        persona = load_persona("sage")
+        persona = personas["sage"]
         formatted = format_discovery_prompt(persona, emotional_state="vulnerable")
         assert "vulnerable" in formatted
         assert "Emotional check-in" in formatted or "emotional" in formatted.lower()
 
-    def test_includes_task_instructions(self):
+    def test_includes_task_instructions(self, personas):
         """Test that prompt includes task instructions."""
-        persona = load_persona("margot")
+        persona = personas["margot"]
         formatted = format_discovery_prompt(persona)
         assert "Read the content" in formatted
         assert "Choose 2-4 questions" in formatted
@@ -594,9 +538,9 @@ class TestFormatDiscoveryPrompt:
 class TestFormatFeedbackWithTiers:
     """Tests for format_feedback_with_tiers function."""
 
-    def test_formats_all_tiers(self):
+    def test_formats_all_tiers(self, personas):
         """Test that all feedback tiers are formatted."""
-        persona = load_persona("margot")
+        persona = personas["margot"]
         items = [
             {"tier": "critical", "content": "Fix this structure issue"},
             {"tier": "recommended", "content": "Consider tightening the prose"},
@@ -606,9 +550,9 @@ class TestFormatFeedbackWithTiers:
         assert persona.feedback_tiers.critical_label in formatted
         assert "Fix this structure issue" in formatted
 
-    def test_groups_by_tier(self):
+    def test_groups_by_tier(self, personas):
         """Test that items are grouped by tier."""
-        persona = load_persona("sage")
+        persona = personas["sage"]
         items = [
             {"tier": "critical", "content": "Item 1"},
             {"tier": "optional", "content": "Item 2"},
@@ -616,13 +560,13 @@ class TestFormatFeedbackWithTiers:
         ]
         formatted = format_feedback_with_tiers(persona, items)
         # Both critical items should appear before optional
-        critical_pos = formatted.find("Item 1")
-        optional_pos = formatted.find("Item 2")
-        assert critical_pos < optional_pos
+        optional_pos = formatted.index("Item 2")
+        assert formatted.index("Item 1") < optional_pos
+        assert formatted.index("Item 3") < optional_pos
 
-    def test_handles_missing_tiers(self):
+    def test_handles_missing_tiers(self, personas):
         """Test that missing tiers are handled gracefully."""
-        persona = load_persona("blueprint")
+        persona = personas["blueprint"]
         items = [{"tier": "critical", "content": "Only critical item"}]
         formatted = format_feedback_with_tiers(persona, items)
         assert "Only critical item" in formatted
@@ -632,16 +576,14 @@ class TestFormatFeedbackWithTiers:
 class TestPersonaDiscoveryIntegration:
     """Integration tests for persona discovery in prompts."""
 
-    def test_full_prompt_includes_discovery(self):
+    def test_full_prompt_includes_discovery(self, formatted_personas):
         """Test that full persona prompt includes discovery section."""
-        persona = load_persona("margot")
-        formatted = format_persona_for_prompt(persona)
+        formatted = formatted_personas["margot"]
         assert "Discovery Approach" in formatted
         assert "ASK questions" in formatted
 
-    def test_full_prompt_includes_feedback_tiers(self):
+    def test_full_prompt_includes_feedback_tiers(self, personas, formatted_personas):
         """Test that full persona prompt includes feedback tiers."""
-        persona = load_persona("margot")
-        formatted = format_persona_for_prompt(persona)
+        formatted = formatted_personas["margot"]
         assert "Feedback Priority Labels" in formatted
-        assert persona.feedback_tiers.critical_label in formatted
+        assert personas["margot"].feedback_tiers.critical_label in formatted
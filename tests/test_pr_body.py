@@ -1,14 +1,8 @@
 """Tests for rich PR body generation."""
 
-import sys
-from pathlib import Path
-
 import pytest
 from pydantic import ValidationError
 
-# Add scripts path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / ".github" / "scripts"))
-
 from scripts.utils.pr_body import (
     ContentAnalysis,
     DecisionRecord,
@@ -53,9 +53,6 @@ class TestSeedScript:
 
     def test_load_seeds_function(self):
         """load_seeds should return seed data."""
-        import sys
-
-        sys.path.insert(0, str(Path(__file__).parent.parent / "seeds"))
         from seed import load_seeds
 
         data = load_seeds()
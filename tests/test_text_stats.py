@@ -2,12 +2,6 @@
 
 import pytest
 
-# Import the module
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / ".github" / "scripts"))
-
 from analyze_text_stats import (
     TextStats,
     ChapterStats,